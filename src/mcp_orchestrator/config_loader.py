@@ -3,10 +3,13 @@
 Allows pre-configuring servers at startup via a JSON configuration file.
 """
 
+import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
 
 from .models import AuthConfig, ServerConfigEntry, ServerConfigFile, ServerRegistration
 from .server.registry import ServerRegistry
@@ -17,17 +20,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ijson is optional: when installed, the servers array is streamed entry by
+# entry instead of loading the whole document first
+try:
+    import ijson
+    _IJSON_AVAILABLE = True
+except ImportError:
+    _IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _build_value(events: Iterator[Tuple[str, str, Any]], event: str, value: Any) -> Any:
+    """Assemble one JSON value from ijson events, starting at its first event."""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+        _, event, value = next(events)
+
 
 class ServerConfigLoader:
     """Loads and registers servers from a configuration file."""
     
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, max_concurrency: int = 16):
         """Initialize the config loader.
         
         Args:
             config_path: Path to the server configuration JSON file
+            max_concurrency: Maximum number of servers registered at once
         """
         self.config_path = config_path
+        self.max_concurrency = max(1, max_concurrency)
     
     async def load_and_register(
         self,
@@ -46,39 +80,8 @@ class ServerConfigLoader:
             Summary dict with servers_loaded, servers_failed, servers_skipped, total_tools
         """
         if not self.config_path.exists():
-            logger.info(f"Server config file not found: {self.config_path}")
-            return {
-                "servers_loaded": 0,
-                "servers_failed": 0,
-                "servers_skipped": 0,
-                "total_tools": 0,
-                "servers": [],
-            }
-        
-        try:
-            with open(self.config_path, "r") as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse server config: {e}")
-            return {
-                "servers_loaded": 0,
-                "servers_failed": 0,
-                "servers_skipped": 0,
-                "total_tools": 0,
-                "servers": [],
-            }
-        
-        try:
-            config = ServerConfigFile.model_validate(config_data)
-        except Exception as e:
-            logger.error(f"Invalid server config: {e}")
-            return {
-                "servers_loaded": 0,
-                "servers_failed": 0,
-                "servers_skipped": 0,
-                "total_tools": 0,
-                "servers": [],
-            }
+            logger.info("Server config file not found: %s", self.config_path)
+            return self._empty_summary()
         
         servers_loaded = 0
         servers_failed = 0
@@ -86,20 +89,57 @@ class ServerConfigLoader:
         total_tools = 0
         loaded_servers: List[Dict[str, Any]] = []
         
-        for entry in config.servers:
-            if not entry.enabled:
-                logger.debug(f"Skipping disabled server: {entry.name}")
-                servers_skipped += 1
-                continue
-            
-            result = await self._register_server(
-                entry=entry,
-                registry=registry,
-                tool_search=tool_search,
-                mcp_server=mcp_server,
-            )
+        # Servers are independent, so register them concurrently; the
+        # semaphore keeps a large config from stampeding downstream servers.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def register_bounded(entry: ServerConfigEntry) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._register_server(
+                    entry=entry,
+                    registry=registry,
+                    tool_search=tool_search,
+                    mcp_server=mcp_server,
+                )
+        
+        # The config file is user-supplied, so every entry is fully validated.
+        # Each entry starts registering as soon as it is parsed.
+        enabled_entries: List[ServerConfigEntry] = []
+        tasks: List["asyncio.Task[Dict[str, Any]]"] = []
+        parse_error: Optional[ValueError] = None
+        try:
+            for entry in self._iter_entries():
+                if not entry.enabled:
+                    logger.debug("Skipping disabled server: %s", entry.name)
+                    servers_skipped += 1
+                    continue
+                enabled_entries.append(entry)
+                tasks.append(asyncio.create_task(register_bounded(entry)))
+                # Let the new task start before parsing the next entry
+                await asyncio.sleep(0)
+        except ValidationError as e:
+            logger.error("Invalid server config: %s", e)
+            parse_error = e
+        except ValueError as e:
+            logger.error("Failed to parse server config: %s", e)
+            parse_error = e
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if parse_error is not None:
+            # A bad file registers nothing, however far parsing got
+            await self._roll_back(enabled_entries, results, registry, tool_search)
+            return self._empty_summary()
+        
+        for entry, result in zip(enabled_entries, results):
+            if isinstance(result, BaseException):
+                result = {"success": False, "error": str(result), "tool_count": 0}
             
             if result["success"]:
+                # Exposed only now that the whole file has parsed, so a file
+                # that fails part way never leaves tools behind in tools/list
+                if entry.expose_tools and result["tools"]:
+                    mcp_server._expose_tools(entry.name, result["tools"])
                 servers_loaded += 1
                 total_tools += result["tool_count"]
                 loaded_servers.append({
@@ -110,19 +150,19 @@ class ServerConfigLoader:
                 })
             else:
                 servers_failed += 1
-                logger.warning(f"Failed to load server '{entry.name}': {result['error']}")
+                logger.warning("Failed to load server '%s': %s", entry.name, result['error'])
         
         logger.info(
-            f"Server config loaded: {servers_loaded} loaded, "
-            f"{servers_failed} failed, {servers_skipped} skipped, "
-            f"{total_tools} total tools"
+            "Server config loaded: %s loaded, %s failed, %s skipped, %s total tools",
+            servers_loaded, servers_failed, servers_skipped, total_tools,
         )
         
-        if loaded_servers:
+        # Only build the per-server summaries if they will actually be emitted
+        if loaded_servers and logger.isEnabledFor(logging.INFO):
             server_names = [s["name"] for s in loaded_servers]
-            logger.info(f"Servers: {server_names}")
+            logger.info("Servers: %s", server_names)
             tool_summary = ", ".join([f"{s['name']}({s['tool_count']} tools)" for s in loaded_servers])
-            logger.info(f"Tool summary: {tool_summary}")
+            logger.info("Tool summary: %s", tool_summary)
         
         return {
             "servers_loaded": servers_loaded,
@@ -132,6 +172,84 @@ class ServerConfigLoader:
             "servers": loaded_servers,
         }
     
+    def _empty_summary(self) -> Dict[str, Any]:
+        """Summary returned when no servers could be read from the config."""
+        return {
+            "servers_loaded": 0,
+            "servers_failed": 0,
+            "servers_skipped": 0,
+            "total_tools": 0,
+            "servers": [],
+        }
+    
+    async def _roll_back(
+        self,
+        entries: List[ServerConfigEntry],
+        results: List[Any],
+        registry: ServerRegistry,
+        tool_search: ToolSearchService,
+    ) -> None:
+        """Undo the registrations made before the config failed to parse."""
+        for entry, result in zip(entries, results):
+            # Failed entries never registered, or hit a pre-existing server
+            if isinstance(result, BaseException) or not result["success"]:
+                continue
+            tool_search.remove_server_tools(entry.name)
+            await registry.unregister(entry.name)
+    
+    def _iter_entries(self) -> Iterator[ServerConfigEntry]:
+        """Parse and validate the server entries in the config file.
+        
+        With ijson, entries are yielded as they are parsed; otherwise the
+        whole file is validated before the first one is yielded.
+        
+        Raises:
+            ValidationError: If an entry or the document fails validation
+            ValueError: If the file is not valid JSON
+        """
+        if _IJSON_AVAILABLE:
+            with open(self.config_path, "rb") as f:
+                try:
+                    yield from self._stream_entries(f)
+                except ijson.JSONError as e:
+                    raise ValueError(str(e)) from e
+            return
+        
+        if _ORJSON_AVAILABLE:
+            config_data = orjson.loads(self.config_path.read_bytes())
+        else:
+            with open(self.config_path, "r") as f:
+                config_data = json.load(f)
+        yield from ServerConfigFile.model_validate(config_data).servers
+    
+    def _stream_entries(self, f: IO[bytes]) -> Iterator[ServerConfigEntry]:
+        """Yield validated entries from the servers array while parsing.
+        
+        Everything outside the array is small, so it is collected and
+        validated against ServerConfigFile once the document ends. The
+        streaming path therefore rejects the same documents as json.load.
+        """
+        events = ijson.parse(f, use_float=True)
+        _, event, value = next(events)
+        if event != "start_map":
+            ServerConfigFile.model_validate(_build_value(events, event, value))
+        
+        header: Dict[str, Any] = {}
+        for prefix, event, value in events:
+            if event != "map_key" or prefix != "":
+                continue
+            key = value
+            _, event, value = next(events)
+            if key == "servers" and event == "start_array":
+                for _, event, value in events:
+                    if event == "end_array":
+                        break
+                    yield ServerConfigEntry.model_validate(_build_value(events, event, value))
+            else:
+                header[key] = _build_value(events, event, value)
+        
+        ServerConfigFile.model_validate(header)
+    
     async def _register_server(
         self,
         entry: ServerConfigEntry,
@@ -148,7 +266,7 @@ class ServerConfigLoader:
             mcp_server: MCPOrchestratorServer instance
         
         Returns:
-            Dict with success, error, tool_count
+            Dict with success, error, tool_count and the discovered tools
         """
         try:
             auth_config = AuthConfig(
@@ -167,13 +285,17 @@ class ServerConfigLoader:
                 connection_mode=entry.connection_mode,
                 auth=auth_config,
                 auto_discover=entry.auto_discover,
+                loading_mode=entry.loading_mode,
+                expose_tools=entry.expose_tools,
             )
             
             await registry.register(registration)
-            logger.info(f"Registered server '{entry.name}' from config")
+            logger.info("Registered server '%s' from config", entry.name)
             
-            tool_count = 0
-            if entry.auto_discover:
+            tools: List[Dict[str, Any]] = []
+            if entry.auto_discover and entry.loading_mode == "deferred":
+                logger.info("Deferred tool discovery for '%s' until first use", entry.name)
+            elif entry.auto_discover:
                 try:
                     tools = await mcp_server._discover_tools(
                         name=entry.name,
@@ -190,28 +312,17 @@ class ServerConfigLoader:
                         tool_search.index_tools(entry.name, tools)
                         await registry.update_tool_count(entry.name, len(tools))
                         
-                        tool_count = len(tools)
-                        
-                        # Only create dynamic tools if expose_tools is enabled
-                        # Otherwise, tools are available via call_remote_tool and search only
-                        if entry.expose_tools:
-                            for tool_data in tools:
-                                tool_name = tool_data.get("name")
-                                if tool_name:
-                                    try:
-                                        mcp_server._create_dynamic_tool(entry.name, tool_name, tool_data)
-                                    except Exception as e:
-                                        logger.warning(f"Failed to create dynamic tool '{tool_name}': {e}")
-                            logger.info(f"Exposed {tool_count} tools from '{entry.name}' in tools/list")
-                        else:
-                            logger.info(f"Registered {tool_count} tools from '{entry.name}' (use call_remote_tool to invoke)")
+                        if not entry.expose_tools:
+                            logger.info("Registered %s tools from '%s' (use call_remote_tool to invoke)", len(tools), entry.name)
                 except Exception as e:
-                    logger.warning(f"Tool discovery failed for '{entry.name}': {e}")
+                    tools = []
+                    logger.warning("Tool discovery failed for '%s': %s", entry.name, e)
             
             return {
                 "success": True,
                 "error": None,
-                "tool_count": tool_count,
+                "tool_count": len(tools),
+                "tools": tools,
             }
             
         except Exception as e:
@@ -219,4 +330,5 @@ class ServerConfigLoader:
                 "success": False,
                 "error": str(e),
                 "tool_count": 0,
+                "tools": [],
             }
@@ -5,10 +5,16 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+    _UVLOOP_AVAILABLE = True
+except ImportError:
+    _UVLOOP_AVAILABLE = False
+
 from .config_loader import ServerConfigLoader
 from .models import OrchestratorConfig
 from .mcp_server import MCPOrchestratorServer
@@ -21,6 +27,8 @@ from .tools.search import ToolSearchService
 # Load .env file if it exists
 load_dotenv()
 
+T = TypeVar("T")
+
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Setup logging configuration."""
@@ -38,37 +46,45 @@ def create_storage(config: OrchestratorConfig) -> StorageBackend:
     return InMemoryStorage()
 
 
+def _env(name: str, cast: Callable[[str], T], default: str) -> T:
+    """Read an environment variable and coerce it, naming the variable on failure."""
+    raw = os.getenv(name, default)
+    try:
+        return cast(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid value for {name}: {raw!r}") from e
+
+
 def create_config_from_env() -> OrchestratorConfig:
     """Create configuration from environment variables."""
 
     return OrchestratorConfig(
-        storage_backend=os.getenv("STORAGE_BACKEND", "memory"),
-        redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
-        tool_cache_ttl=int(os.getenv("MCP_ORCHESTRATOR_TOOL_CACHE_TTL", "300")),
-        default_connection_mode=os.getenv("MCP_ORCHESTRATOR_DEFAULT_CONNECTION_MODE", "stateless"),
-        connection_timeout=float(os.getenv("MCP_ORCHESTRATOR_CONNECTION_TIMEOUT", "30.0")),
-        max_retries=int(os.getenv("MCP_ORCHESTRATOR_MAX_RETRIES", "3")),
-        http_host=os.getenv("ORCHESTRATOR_HTTP_HOST", "0.0.0.0"),
-        http_port=int(os.getenv("ORCHESTRATOR_PORT", "8080")),
-        mcp_transport=os.getenv("ORCHESTRATOR_TRANSPORT", "stdio"),
-        auth_mode=os.getenv("ORCHESTRATOR_AUTH_MODE", "auto"),
-        server_config_path=os.getenv("SERVER_CONFIG_PATH", "server_config.json"),
-        log_level=os.getenv("ORCHESTRATOR_LOG_LEVEL", "INFO"),
+        storage_backend=_env("STORAGE_BACKEND", str, "memory"),
+        redis_url=_env("REDIS_URL", str, "redis://localhost:6379/0"),
+        tool_cache_ttl=_env("MCP_ORCHESTRATOR_TOOL_CACHE_TTL", int, "300"),
+        default_connection_mode=_env("MCP_ORCHESTRATOR_DEFAULT_CONNECTION_MODE", str, "stateless"),
+        connection_timeout=_env("MCP_ORCHESTRATOR_CONNECTION_TIMEOUT", float, "30.0"),
+        discovery_timeout=_env("MCP_ORCHESTRATOR_DISCOVERY_TIMEOUT", float, "300.0"),
+        max_retries=_env("MCP_ORCHESTRATOR_MAX_RETRIES", int, "3"),
+        http_host=_env("ORCHESTRATOR_HTTP_HOST", str, "0.0.0.0"),
+        http_port=_env("ORCHESTRATOR_PORT", int, "8080"),
+        mcp_transport=_env("ORCHESTRATOR_TRANSPORT", str, "stdio"),
+        auth_mode=_env("ORCHESTRATOR_AUTH_MODE", str, "auto"),
+        server_config_path=_env("SERVER_CONFIG_PATH", str, "server_config.json"),
+        startup_concurrency=_env("ORCHESTRATOR_STARTUP_CONCURRENCY", int, "16"),
+        log_level=_env("ORCHESTRATOR_LOG_LEVEL", str, "INFO"),
     )
 
 
-def main() -> None:
-    """Main entry point."""
-    # Create configuration from environment
-    config = create_config_from_env()
-    
-    # Setup logging
-    setup_logging(config.log_level)
+async def _main(config: OrchestratorConfig) -> None:
+    """Load configured servers and serve, all on a single event loop.
+
+    Keeping startup, serving and shutdown on one loop lets storage
+    connection pools live for the whole process instead of being rebuilt
+    by separate ``asyncio.run`` calls.
+    """
     logger = logging.getLogger(__name__)
     
-    logger.info("Starting MCP Orchestrator...")
-    logger.info(f"Storage backend: {config.storage_backend}")
-    
     # Create storage backend
     storage = create_storage(config)
     
@@ -80,49 +96,77 @@ def main() -> None:
         tool_search = ToolSearchService()
         
         # Create MCP server
-        server = MCPOrchestratorServer(storage, registry, tool_search, config.auth_mode, config.mcp_transport)
+        server = MCPOrchestratorServer(
+            storage,
+            registry,
+            tool_search,
+            config.auth_mode,
+            config.mcp_transport,
+            discovery_timeout=config.discovery_timeout,
+        )
 
         logger.info("MCP Orchestrator server initialized")
-        logger.info(f"Running with {config.mcp_transport} transport")
+        logger.info("Running with %s transport", config.mcp_transport)
         
         # Load server configuration from file if provided
         if config.server_config_path:
             config_path = Path(config.server_config_path)
             if config_path.exists():
-                logger.info(f"Loading server configuration from: {config_path}")
-                config_loader = ServerConfigLoader(config_path)
-                
-                # Run the async config loader
-                load_result = asyncio.run(
-                    config_loader.load_and_register(registry, tool_search, server)
+                logger.info("Loading server configuration from: %s", config_path)
+                config_loader = ServerConfigLoader(
+                    config_path, max_concurrency=config.startup_concurrency
                 )
                 
+                load_result = await config_loader.load_and_register(registry, tool_search, server)
+                
                 logger.info(
-                    f"Server config loaded: {load_result['servers_loaded']} loaded, "
-                    f"{load_result['servers_failed']} failed, {load_result['servers_skipped']} skipped, "
-                    f"{load_result['total_tools']} total tools"
+                    "Server config loaded: %s loaded, %s failed, %s skipped, %s total tools",
+                    load_result["servers_loaded"], load_result["servers_failed"],
+                    load_result["servers_skipped"], load_result["total_tools"],
                 )
                 
                 if load_result["servers"]:
                     server_list = [s["name"] for s in load_result["servers"]]
-                    logger.info(f"Pre-configured servers: {server_list}")
+                    logger.info("Pre-configured servers: %s", server_list)
             else:
-                logger.debug(f"Server config file not found: {config_path}, skipping")
-        
-        # Run the server (FastMCP handles its own event loop)
-        if config.mcp_transport == "http":
-            server.run(transport=config.mcp_transport, port=config.http_port, host=config.http_host)
-        else:
-            server.run(transport=config.mcp_transport)
+                logger.debug("Server config file not found: %s, skipping", config_path)
         
+        try:
+            if config.mcp_transport == "http":
+                await server.run_async(transport=config.mcp_transport, port=config.http_port, host=config.http_host)
+            else:
+                await server.run_async(transport=config.mcp_transport)
+        finally:
+            await server.close()
+    finally:
+        # Cleanup
+        await storage.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    # Create configuration from environment
+    config = create_config_from_env()
+    
+    # Setup logging
+    setup_logging(config.log_level)
+    logger = logging.getLogger(__name__)
+    
+    logger.info("Starting MCP Orchestrator...")
+    logger.info("Storage backend: %s", config.storage_backend)
+    
+    # uvloop speeds up the socket and subprocess I/O behind discovery and
+    # routing; use it when installed and fall back to the default loop
+    loop_factory = uvloop.new_event_loop if _UVLOOP_AVAILABLE else None
+    
+    try:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(_main(config))
     except KeyboardInterrupt:
         logger.info("Shutting down MCP Orchestrator...")
     except Exception as e:
-        logger.exception(f"Error running MCP Orchestrator: {e}")
+        logger.exception("Error running MCP Orchestrator: %s", e)
         sys.exit(1)
-    finally:
-        # Cleanup
-        asyncio.run(storage.close())
 
 
 if __name__ == "__main__":
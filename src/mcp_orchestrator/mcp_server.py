@@ -1,20 +1,24 @@
 """FastMCP server for MCP Orchestrator."""
 
+import functools
+import inspect
 import logging
-from typing import Optional, Dict, Any, List, Literal
+from typing import Annotated, Optional, Dict, Any, List, Literal, Tuple
 from fastmcp import FastMCP
+from fastmcp.server.dependencies import get_http_headers
+from pydantic import Field
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
-from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.stdio import StdioServerParameters
 import httpx
 import asyncio
 
 from .storage.base import StorageBackend
 from .server.registry import ServerRegistry
 from .tools.search import ToolSearchService
-from .tools.router import ToolRouter
+from .tools.router import ToolRouter, request_headers
 from .models import (
     ServerRegistration,
     ServerInfo,
@@ -24,6 +28,93 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Longest a search waits on deferred discovery before answering from the
+# tools already indexed; discovery keeps running in the background
+_SEARCH_DISCOVERY_WAIT = 5.0
+
+
+def _client_auth_header() -> Optional[str]:
+    """Authorization header of the MCP request being served, if it came over HTTP."""
+    return get_http_headers(include_all=True).get("authorization")
+
+
+# JSON Schema "type" to the Python annotation FastMCP turns back into a schema
+_JSON_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# (name, required, JSON type, description, enum values)
+ParamSpec = Tuple[str, bool, Optional[str], Optional[str], Optional[Tuple[Any, ...]]]
+
+
+def _param_spec(name: str, prop: Any, required: bool) -> ParamSpec:
+    """Reduce a JSON Schema property to the hashable parts the signature keeps."""
+    if not isinstance(prop, dict):
+        prop = {}
+    json_type = prop.get("type")
+    description = prop.get("description")
+    enum = prop.get("enum")
+    enum = tuple(enum) if isinstance(enum, list) and enum else None
+    try:
+        hash(enum)
+    except TypeError:
+        # Non-scalar enum members can't be a Literal; keep just the type
+        enum = None
+    return (
+        name,
+        required,
+        json_type if isinstance(json_type, str) else None,
+        description if isinstance(description, str) else None,
+        enum,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_signature(params: Tuple[ParamSpec, ...]) -> inspect.Signature:
+    """Build a keyword-only, annotated signature from parameter specs.
+    
+    FastMCP derives the tool's input schema from the annotations, so each
+    parameter carries its JSON type (or enum) and description. Signatures
+    are immutable, so tools with identical parameter lists (common across
+    servers) share one cached instance.
+    """
+    parameters = []
+    for name, is_required, json_type, description, enum in params:
+        annotation = Literal[enum] if enum else _JSON_TYPES.get(json_type, Any)
+        if not is_required:
+            annotation = Optional[annotation]
+        if description:
+            annotation = Annotated[annotation, Field(description=description)]
+        parameters.append(inspect.Parameter(
+            name,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=inspect.Parameter.empty if is_required else None,
+            annotation=annotation,
+        ))
+    return inspect.Signature(parameters=parameters)
+
+
+# CORS middleware for browser-based clients of the HTTP transport
+_CORS_MIDDLEWARE = [
+    Middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Allow all origins for orchestrator
+        allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+        allow_headers=[
+            "mcp-protocol-version",
+            "mcp-session-id",
+            "Authorization",
+            "Content-Type",
+        ],
+        expose_headers=["mcp-session-id"],
+    )
+]
+
 
 class MCPOrchestratorServer:
     """FastMCP server implementation for MCP Orchestrator."""
@@ -35,6 +126,7 @@ class MCPOrchestratorServer:
         tool_search: ToolSearchService,
         auth_mode: Literal["auto", "static", "forward"] = "auto",
         transport: Literal["stdio", "http"] = "stdio",
+        discovery_timeout: float = 300.0,
     ):
         """Initialize the MCP Orchestrator server.
 
@@ -44,19 +136,26 @@ class MCPOrchestratorServer:
             tool_search: Tool search service for regex and BM25 search
             auth_mode: Auth mode for the orchestrator (auto, static, forward)
             transport: Transport mode for the orchestrator (stdio or http)
+            discovery_timeout: Seconds allowed for connecting to a downstream
+                server and listing its tools
         """
         self._storage = storage
         self._registry = server_registry
         self._tool_search = tool_search
         self._auth_mode = auth_mode
         self._transport = transport
+        self._discovery_timeout = discovery_timeout
         self._tool_router = ToolRouter(auth_mode=auth_mode, transport=transport)
 
         # Track which deferred tools have been activated as live FastMCP tools
         self._active_tools: set[str] = set()
+        # In-flight deferred discoveries, at most one per server
+        self._discovery_tasks: Dict[str, asyncio.Task] = {}
 
         # Initialize FastMCP server
         self._mcp = FastMCP("mcp-orchestrator")
+        # HTTP app, built on first use by _http_app()
+        self._app = None
         
         # Register search tools
         self._register_search_tools()
@@ -92,12 +191,64 @@ class MCPOrchestratorServer:
                 stdio_command = command or url
                 return await self._discover_tools_stdio(name, stdio_command, args, env)
             else:
-                logger.warning(f"Unsupported transport '{transport}' for server '{name}'")
+                logger.warning("Unsupported transport '%s' for server '%s'", transport, name)
                 return []
         except Exception as e:
-            logger.error(f"Error discovering tools from '{name}': {e}")
+            logger.error("Error discovering tools from '%s': %s", name, e)
             raise
 
+    async def _ensure_discovered(self, server_name: str) -> None:
+        """Discover and index tools for a deferred server on first use."""
+        async def discover(server: ServerInfo) -> List[Dict[str, Any]]:
+            auth_config = await self._registry.get_auth_config(server.name)
+            return await self._discover_tools(
+                name=server.name,
+                url=server.url,
+                transport=server.transport,
+                command=server.command,
+                args=server.args,
+                env=server.env,
+                auth_headers=auth_config.headers if auth_config else None,
+            )
+        
+        try:
+            tools = await self._registry.ensure_discovered(server_name, discover)
+        except Exception as e:
+            logger.warning("Deferred tool discovery failed for '%s': %s", server_name, e)
+            return
+        
+        if tools is not None:
+            self._tool_search.index_tools(server_name, tools)
+            logger.info("Discovered %s deferred tools from '%s'", len(tools), server_name)
+            server = await self._registry.get(server_name)
+            if server and server.expose_tools:
+                self._expose_tools(server_name, tools)
+    
+    def _start_discovery(self, server_name: str) -> asyncio.Task:
+        """Run deferred discovery for a server in the background, once at a time."""
+        task = self._discovery_tasks.get(server_name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._ensure_discovered(server_name))
+            self._discovery_tasks[server_name] = task
+            task.add_done_callback(
+                lambda t: self._discovery_tasks.pop(server_name, None)
+                if self._discovery_tasks.get(server_name) is t else None
+            )
+        return task
+    
+    async def _discover_pending_servers(self) -> None:
+        """Start deferred discovery for every pending server.
+        
+        Waits at most _SEARCH_DISCOVERY_WAIT seconds; slower servers finish
+        in the background and their tools show up in later searches.
+        """
+        pending = self._registry.pending_discovery()
+        if pending:
+            await asyncio.wait(
+                [self._start_discovery(name) for name in pending],
+                timeout=_SEARCH_DISCOVERY_WAIT,
+            )
+
     def _extract_tools_from_response(
         self,
         response: Any,
@@ -112,17 +263,18 @@ class MCPOrchestratorServer:
         Returns:
             List of tool definition dicts
         """
-        tools = []
-        for tool in response.tools:
-            tool_data = {
+        tools = [
+            {
                 "name": tool.name,
                 "description": tool.description or "",
                 "input_schema": tool.inputSchema,
             }
-            tools.append(tool_data)
-            logger.debug(f"Discovered tool: {tool.name}")
+            for tool in response.tools
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Discovered tools: %s", [tool["name"] for tool in tools])
         
-        logger.info(f"Discovered {len(tools)} tools from '{server_name}'")
+        logger.info("Discovered %s tools from '%s'", len(tools), server_name)
         return tools
 
     async def _discover_tools_with_session(
@@ -145,11 +297,12 @@ class MCPOrchestratorServer:
                     return self._extract_tools_from_response(response, server_name)
         elif transport == "stdio":
             assert stdio_params is not None
-            async with stdio_client(stdio_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    response = await session.list_tools()
-                    return self._extract_tools_from_response(response, server_name)
+            # stdio sessions are persistent and owned by the router, so the
+            # subprocess is reused by later discoveries and tool calls
+            response = await self._tool_router.stdio_request(
+                server_name, stdio_params, lambda session: session.list_tools()
+            )
+            return self._extract_tools_from_response(response, server_name)
         else:
             raise ValueError(f"Unsupported transport: {transport}")
     
@@ -160,13 +313,15 @@ class MCPOrchestratorServer:
         auth_headers: Optional[Dict[str, str]] = None,
     ) -> List[Dict[str, Any]]:
         """Discover tools from a downstream MCP server using HTTP streamable transport."""
-        logger.info(f"Connecting to HTTP streamable endpoint: {url}")
+        logger.info("Connecting to HTTP streamable endpoint: %s", url)
         
-        headers = auth_headers or {}
+        # Pooled by the router, but with the discovery budget as its httpx
+        # timeout; the router's tool-call timeout would cut off slow list_tools
+        http_client = self._tool_router.http_client(url, timeout=self._discovery_timeout)
         
         try:
-            async with httpx.AsyncClient(headers=headers, timeout=30.0) as http_client:
-                async with asyncio.timeout(30):
+            with request_headers(auth_headers):
+                async with asyncio.timeout(self._discovery_timeout):
                     return await self._discover_tools_with_session(
                         transport="http",
                         server_name=name,
@@ -174,11 +329,10 @@ class MCPOrchestratorServer:
                         http_client=http_client,
                     )
         except asyncio.TimeoutError:
-            logger.error(f"Timeout discovering tools from '{name}'")
-            raise ConnectionError(f"Connection to '{name}' timed out after 30 seconds")
-        except Exception as e:
-            logger.error(f"Error discovering tools from '{name}': {e}")
-            raise
+            logger.error("Timeout discovering tools from '%s'", name)
+            raise ConnectionError(
+                f"Connection to '{name}' timed out after {self._discovery_timeout} seconds"
+            )
     
     async def _discover_tools_stdio(
         self,
@@ -188,7 +342,7 @@ class MCPOrchestratorServer:
         env: Optional[Dict[str, str]] = None,
     ) -> List[Dict[str, Any]]:
         """Discover tools from a downstream MCP server using stdio transport."""
-        logger.info(f"Connecting to stdio MCP server: {command}")
+        logger.info("Connecting to stdio MCP server: %s", command)
         
         stdio_params = StdioServerParameters(
             command=command,
@@ -197,7 +351,7 @@ class MCPOrchestratorServer:
         )
         
         try:
-            async with asyncio.timeout(30):
+            async with asyncio.timeout(self._discovery_timeout):
                 return await self._discover_tools_with_session(
                     transport="stdio",
                     server_name=name,
@@ -205,11 +359,10 @@ class MCPOrchestratorServer:
                     stdio_params=stdio_params,
                 )
         except asyncio.TimeoutError:
-            logger.error(f"Timeout discovering tools from '{name}'")
-            raise ConnectionError(f"Connection to '{name}' timed out after 30 seconds")
-        except Exception as e:
-            logger.error(f"Error discovering tools from '{name}': {e}")
-            raise
+            logger.error("Timeout discovering tools from '%s'", name)
+            raise ConnectionError(
+                f"Connection to '{name}' timed out after {self._discovery_timeout} seconds"
+            )
     
     def _register_search_tools(self) -> None:
         """Register search tools for the orchestrator."""
@@ -247,6 +400,10 @@ class MCPOrchestratorServer:
                         "error": "Query exceeds 200 character limit",
                     }
                 
+                # Deferred servers are discovered on the first search; a slow
+                # one is left running rather than holding up the results
+                await self._discover_pending_servers()
+                
                 # Perform search (BM25 by default, regex if requested)
                 tool_refs = self._tool_search.search(query, limit=max_results, use_regex=use_regex)
                 
@@ -284,14 +441,14 @@ class MCPOrchestratorServer:
                 
             except ValueError as e:
                 # Invalid regex pattern
-                logger.warning(f"Invalid regex pattern: {query} - {e}")
+                logger.warning("Invalid regex pattern: %s - %s", query, e)
                 return {
                     "success": False,
                     "error_code": "invalid_pattern",
                     "error": f"Invalid regex pattern: {str(e)}",
                 }
             except Exception as e:
-                logger.exception(f"Error in tool search: {e}")
+                logger.exception("Error in tool search: %s", e)
                 return {
                     "success": False,
                     "error_code": "unavailable",
@@ -321,23 +478,29 @@ class MCPOrchestratorServer:
                 arguments = {}
             
             # Parse server name from tool name (format: server_name__tool_name)
-            if "__" not in tool_name:
+            server_name, sep, actual_tool_name = tool_name.partition("__")
+            if not sep:
                 raise ValueError(f"Invalid tool name format '{tool_name}'. Expected format: 'server_name__tool_name' (e.g., 'context7__query-docs')")
             
-            server_name, actual_tool_name = tool_name.split("__", 1)
-            
             # Get server info
             server_info = await self._registry.get(server_name)
             if not server_info:
                 raise ValueError(f"Server '{server_name}' not found. Add it to server_config.json to register.")
             
+            # Calling a tool doesn't need its server's tool list, so deferred
+            # discovery runs in the background instead of delaying the call
+            self._start_discovery(server_name)
+            
             # Determine auth headers to use
             auth_headers = None
+            client_auth_header = None
             if auth_header:
                 # User provided auth header takes priority
                 auth_headers = {"Authorization": auth_header}
             else:
-                # Fall back to registered auth config
+                # Fall back to the client's own header (forwarded when the
+                # auth mode allows it), then the registered auth config
+                client_auth_header = _client_auth_header()
                 auth_config = await self._registry.get_auth_config(server_name)
                 if auth_config and auth_config.headers:
                     auth_headers = auth_config.headers
@@ -353,42 +516,39 @@ class MCPOrchestratorServer:
                 args=server_info.args,
                 env=server_info.env,
                 auth_headers=auth_headers,
+                client_auth_header=client_auth_header,
             )
     
     async def register_dynamic_tools(self) -> None:
-        """Register dynamically discovered tools from downstream servers.
+        """Index the stored tools of all registered servers for search.
         
-        This method discovers tools from all registered servers and creates
-        proxied tools with namespaced names (server_name__tool_name).
+        Tools are not registered as FastMCP tools here; each one is
+        activated under its namespaced name (server_name__tool_name) the
+        first time ``tool_search`` returns it.
         """
         try:
             servers = await self._registry.list_all()
             
-            for server in servers:
-                try:
-                    tools = await self._registry.get_tools(server.name)
-                    
-                    for tool_data in tools:
-                        tool_name = tool_data.get("name")
-                        if not tool_name:
-                            continue
-                        
-                        namespaced_name = f"{server.name}__{tool_name}"
-                        
-                        # Create dynamic tool function
-                        self._create_dynamic_tool(server.name, tool_name, tool_data)
-                        
-                    # Index tools for search
-                    self._tool_search.index_tools(server.name, tools)
-                    
-                    # Update tool count
-                    await self._registry.update_tool_count(server.name, len(tools))
-                    
-                except Exception as e:
-                    logger.error(f"Error loading tools from server '{server.name}': {e}")
+            # Servers are independent, so load them concurrently; each
+            # server's errors are logged by _load_server itself
+            await asyncio.gather(*(self._load_server(server) for server in servers))
                     
         except Exception as e:
-            logger.exception(f"Error registering dynamic tools: {e}")
+            logger.exception("Error registering dynamic tools: %s", e)
+    
+    async def _load_server(self, server: ServerInfo) -> None:
+        """Index the stored tools of one registered server."""
+        try:
+            tools = await self._registry.get_tools(server.name)
+            
+            # Index tools for search
+            self._tool_search.index_tools(server.name, tools)
+            
+            # Update tool count
+            await self._registry.update_tool_count(server.name, len(tools))
+            
+        except Exception as e:
+            logger.error("Error loading tools from server '%s': %s", server.name, e)
     
     def _create_dynamic_tool(
         self,
@@ -403,60 +563,23 @@ class MCPOrchestratorServer:
             tool_name: Name of the tool on the upstream server
             tool_data: Tool definition data including description and input_schema
         """
-        import inspect
-        from typing import get_type_hints, Optional
-        
         namespaced_name = f"{server_name}__{tool_name}"
         description = tool_data.get("description", "")
         input_schema = tool_data.get("input_schema", {})
         
-        # Build a comprehensive description including server info and schema
-        full_description = f"""{description}
-
-This tool is proxied from '{server_name}' server via MCP Orchestrator.
-Original tool name: {tool_name}
-
-Input Schema:
-{input_schema}
-"""
+        # The parameter schema is derived from the signature, so the
+        # description only notes where the tool is proxied from
+        full_description = f"{description}\n\n(Proxied from '{server_name}'.)"
         
         # Extract parameters from input_schema
         properties = input_schema.get("properties", {})
-        required = input_schema.get("required", [])
-        
-        # Build function signature parameters
-        sig_params = []
-        for param_name, param_info in properties.items():
-            param_type = param_info.get("type", "str")
-            is_required = param_name in required
-            
-            # Map JSON schema types to Python types
-            type_map = {
-                "string": "str",
-                "number": "float",
-                "integer": "int",
-                "boolean": "bool",
-                "array": "list",
-                "object": "dict",
-            }
-            py_type = type_map.get(param_type, "str")
-            
-            # Create default value for optional params
-            if is_required:
-                default = ...
-            else:
-                default = None
-            
-            # Create the parameter
-            param = inspect.Parameter(
-                param_name,
-                inspect.Parameter.KEYWORD_ONLY,
-                default=default,
-            )
-            sig_params.append(param)
+        required = set(input_schema.get("required", []))
         
-        # Create function signature
-        sig = inspect.Signature(parameters=sig_params)
+        # Build function signature (keyword-only, optional params default to None)
+        sig = _build_signature(tuple(
+            _param_spec(param_name, prop, param_name in required)
+            for param_name, prop in properties.items()
+        ))
         
         # Create closure to capture server_name and tool_name
         def make_tool_handler(srv_name: str, t_name: str, signature: inspect.Signature):
@@ -481,10 +604,15 @@ Input Schema:
                     args=server_info.args,
                     env=server_info.env,
                     auth_headers=auth_headers,
+                    client_auth_header=_client_auth_header(),
                 )
             
-            # Set the signature on the function
+            # Set the signature on the function; pydantic reads the parameter
+            # types from __annotations__, so mirror them there too
             dynamic_tool.__signature__ = signature
+            dynamic_tool.__annotations__ = {
+                name: param.annotation for name, param in signature.parameters.items()
+            }
             return dynamic_tool
         
         # Create the tool handler with captured values
@@ -497,39 +625,59 @@ Input Schema:
         # Register with FastMCP using decorator pattern
         self._mcp.tool(name=namespaced_name)(dynamic_tool)
         
-        logger.debug(f"Registered dynamic tool: {namespaced_name}")
+        logger.debug("Registered dynamic tool: %s", namespaced_name)
     
-    async def _activate_tools_from_refs(self, tool_refs: List[Any]) -> None:
+    async def _activate_tools_from_refs(self, tool_refs: List[ToolReference]) -> None:
         """Activate deferred tools by registering them as live FastMCP tools.
         
         This is called after search discovers tools to make them callable.
         Idempotent - skips tools that are already registered.
         """
-        for ref in tool_refs:
+        # References carry the server and tool names, so nothing is parsed here
+        pending = [ref for ref in tool_refs if ref.namespaced_name not in self._active_tools]
+        if not pending:
+            return
+        
+        # Fetch metadata for all pending tools in one storage round trip
+        metas = await self._registry.get_tool_metadata_many(
+            [ref.namespaced_name for ref in pending]
+        )
+        
+        for ref, meta in zip(pending, metas):
             namespaced_name = ref.namespaced_name
-            
-            # Skip if already activated
-            if namespaced_name in self._active_tools:
-                continue
-            
-            # Parse server and tool names
-            if "__" not in namespaced_name:
-                logger.warning(f"Invalid namespaced tool name: {namespaced_name}")
-                continue
-            
-            server_name, tool_name = namespaced_name.split("__", 1)
-            
-            # Get tool metadata
-            meta = await self._registry.get_tool_metadata(namespaced_name)
             if meta is None:
-                logger.warning(f"Metadata not found for tool: {namespaced_name}")
+                logger.warning("Metadata not found for tool: %s", namespaced_name)
                 continue
             
             # Register as live FastMCP tool
-            self._create_dynamic_tool(server_name, tool_name, meta)
+            self._create_dynamic_tool(ref.server_name, ref.tool_name, meta)
             self._active_tools.add(namespaced_name)
             
-            logger.debug(f"Activated deferred tool: {namespaced_name}")
+            logger.debug("Activated deferred tool: %s", namespaced_name)
+    
+    def _expose_tools(self, server_name: str, tools: List[Dict[str, Any]]) -> None:
+        """Register a server's tools as live FastMCP tools (expose_tools)."""
+        for tool_data in tools:
+            tool_name = tool_data.get("name")
+            if not tool_name:
+                continue
+            namespaced_name = f"{server_name}__{tool_name}"
+            if namespaced_name in self._active_tools:
+                continue
+            try:
+                self._create_dynamic_tool(server_name, tool_name, tool_data)
+                self._active_tools.add(namespaced_name)
+            except Exception as e:
+                logger.warning("Failed to create dynamic tool '%s': %s", tool_name, e)
+        logger.info("Exposed %s tools from '%s' in tools/list", len(tools), server_name)
+    
+    async def close(self) -> None:
+        """Stop background discovery and release pooled router connections."""
+        tasks = list(self._discovery_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._tool_router.close()
     
     def get_mcp(self) -> FastMCP:
         """Get the FastMCP instance."""
@@ -544,27 +692,35 @@ Input Schema:
             host: Host for HTTP transport
         """
         if transport == "http" and port:
-            # Use HTTP transport with CORS middleware for browser-based clients
-            middleware = [
-                Middleware(
-                    CORSMiddleware,
-                    allow_origins=["*"],  # Allow all origins for orchestrator
-                    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
-                    allow_headers=[
-                        "mcp-protocol-version",
-                        "mcp-session-id",
-                        "Authorization",
-                        "Content-Type",
-                    ],
-                    expose_headers=["mcp-session-id"],
-                )
-            ]
-            http_app = self._mcp.http_app(middleware=middleware)
             import uvicorn
-            uvicorn.run(http_app, host=host, port=port, log_level="info")
+            uvicorn.run(self._http_app(), host=host, port=port, log_level="info")
         else:
             self._mcp.run(transport="stdio")
 
+    async def run_async(
+        self,
+        transport: Literal["stdio", "http"] = "stdio",
+        port: Optional[int] = None,
+        host: str = "0.0.0.0",
+    ) -> None:
+        """Run the MCP server on the current event loop.
+
+        Same as ``run`` but awaitable, so callers can share one loop (and its
+        storage connections) between startup, serving and shutdown.
+        """
+        if transport == "http" and port:
+            import uvicorn
+            config = uvicorn.Config(self._http_app(), host=host, port=port, log_level="info")
+            await uvicorn.Server(config).serve()
+        else:
+            await self._mcp.run_async(transport="stdio")
+
+    def _http_app(self):
+        """Return the HTTP app with CORS middleware, building it on first use."""
+        if self._app is None:
+            self._app = self._mcp.http_app(middleware=_CORS_MIDDLEWARE)
+        return self._app
+
 
 async def create_mcp_server(
     storage: StorageBackend,
@@ -1,7 +1,7 @@
 """Data models for MCP Orchestrator."""
 
 from datetime import datetime
-from typing import Optional, Literal, Dict, Any, List
+from typing import Annotated, Optional, Literal, Dict, Any, List
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -11,8 +11,12 @@ TransportMode = Literal["stdio", "http"]
 AuthType = Literal["none", "static", "forward"]
 AuthMode = Literal["auto", "static", "forward"]
 ConnectionMode = Literal["stateful", "stateless"]
+LoadingMode = Literal["eager", "deferred"]
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 
+# Shared by every model that accepts a server name from outside
+ServerName = Annotated[str, Field(description="Unique server name", min_length=1)]
+
 
 class ToolSearchErrorCode(str, Enum):
     """Error codes for tool search operations, aligned with Claude's native format."""
@@ -54,7 +58,7 @@ class AuthConfig(BaseModel):
 
 class ServerRegistration(BaseModel):
     """Request to register a new MCP server."""
-    name: str = Field(..., description="Unique server name", min_length=1)
+    name: ServerName
     url: str = Field(..., description="MCP server URL or command for stdio")
     transport: TransportType = "http"
     command: Optional[str] = Field(None, description="Command to run for stdio transport (e.g., 'npx', 'python')")
@@ -63,7 +67,8 @@ class ServerRegistration(BaseModel):
     connection_mode: ConnectionMode = "stateless"
     auth: AuthConfig = Field(default_factory=lambda: AuthConfig(type="none"))
     auto_discover: bool = True
-    loading_mode: Literal["eager", "deferred"] = "eager"
+    loading_mode: LoadingMode = "eager"
+    expose_tools: bool = Field(False, description="Expose discovered tools in tools/list")
 
 
 class ServerInfo(BaseModel):
@@ -81,6 +86,7 @@ class ServerInfo(BaseModel):
     last_health_check: Optional[datetime] = None
     tool_count: int = 0
     error_message: Optional[str] = None
+    expose_tools: bool = False
 
 
 class ToolReference(BaseModel):
@@ -122,6 +128,7 @@ class OrchestratorConfig(BaseModel):
     
     default_connection_mode: ConnectionMode = "stateless"
     connection_timeout: float = 30.0
+    discovery_timeout: float = 300.0
     max_retries: int = 3
     
     http_host: str = "0.0.0.0"
@@ -132,13 +139,14 @@ class OrchestratorConfig(BaseModel):
     auth_mode: AuthMode = "auto"
     
     server_config_path: Optional[str] = "server_config.json"
+    startup_concurrency: int = 16
     
     log_level: LogLevel = "INFO"
 
 
 class ServerConfigEntry(BaseModel):
     """Entry in server_config.json for pre-configuring servers at startup."""
-    name: str = Field(..., description="Unique server name", min_length=1)
+    name: ServerName
     url: str = Field(..., description="MCP server URL or command for stdio")
     transport: TransportType = "http"
     command: Optional[str] = Field(None, description="Command to run for stdio transport")
@@ -149,6 +157,10 @@ class ServerConfigEntry(BaseModel):
     auth_headers: Optional[Dict[str, str]] = Field(None, description="Static auth headers")
     auth_header_name: Optional[str] = "Authorization"
     auto_discover: bool = True
+    loading_mode: LoadingMode = Field(
+        default="eager",
+        description="'eager' discovers tools at startup, 'deferred' on first use"
+    )
     enabled: bool = Field(True, description="Whether to load this server at startup")
     expose_tools: bool = Field(
         default=False, 
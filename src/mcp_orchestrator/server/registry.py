@@ -31,22 +31,78 @@ Storage keys used:
 - orchestrator:server:{name}:auth - Auth configuration for a server
 - orchestrator:server:{name}:tools - Tool list for a server
 - orchestrator:tool_meta:{namespaced_name} - Metadata for individual tools
+- orchestrator:tool_meta_index - Set of namespaced names with stored metadata
 """
 
-from datetime import datetime
-from typing import Optional, Dict, List, Literal, Any
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Literal, Any, Awaitable, Callable, Set, Tuple
+from pydantic import TypeAdapter
 from ..models import ServerInfo, ServerRegistration, AuthConfig
 from ..storage.base import StorageBackend
+from ..storage.memory import InMemoryStorage
 
 ServerStatus = Literal["active", "inactive", "error", "unknown"]
 
+_DATETIME_FIELDS = ("registered_at", "last_health_check")
+
+_TOOL_META_PREFIX = "orchestrator:tool_meta:"
+
+# Backoff before re-dialing a deferred server whose discovery failed;
+# doubles per consecutive failure up to the cap
+_DISCOVERY_RETRY_BASE = 30.0
+_DISCOVERY_RETRY_MAX = 600.0
+
+# Built once at import so writes don't re-resolve the model schema per call
+_SERVER_INFO_ADAPTER: TypeAdapter[ServerInfo] = TypeAdapter(ServerInfo)
+_AUTH_ADAPTER: TypeAdapter[AuthConfig] = TypeAdapter(AuthConfig)
+
+
+def _server_info_from_storage(data: Dict[str, Any]) -> ServerInfo:
+    """Rebuild a ServerInfo from a stored dict without re-validating it.
+
+    Trust boundary: everything under orchestrator:servers was produced by
+    this registry from an already-validated ServerRegistration, so we skip
+    validation with model_construct. Untrusted input (server_config.json,
+    tool arguments) must still go through model_validate.
+    """
+    fields = dict(data)
+    for field in _DATETIME_FIELDS:
+        value = fields.get(field)
+        if isinstance(value, str):
+            # model_construct won't coerce, so parse ISO strings ourselves
+            fields[field] = datetime.fromisoformat(value)
+    return ServerInfo.model_construct(**fields)
+
 
 class ServerRegistry:
     """Registry for managing MCP servers."""
     
-    def __init__(self, storage: StorageBackend):
+    def __init__(self, storage: StorageBackend, enable_cache: Optional[bool] = None):
+        """Initialize the registry.
+        
+        Args:
+            storage: Storage backend for server data
+            enable_cache: Cache server info and auth config in-process. Defaults
+                to on for InMemoryStorage only, since other backends may be
+                shared with other workers whose writes we would not see.
+        """
         self._storage = storage
+        if enable_cache is None:
+            enable_cache = isinstance(storage, InMemoryStorage)
+        self._cache_enabled = enable_cache
+        self._server_cache: Dict[str, ServerInfo] = {}
+        self._auth_cache: Dict[str, Optional[AuthConfig]] = {}
+        # Snapshot of list_all(); reset on every write to the servers hash
+        self._list_cache: Optional[Tuple[ServerInfo, ...]] = None
         self._servers_key = "orchestrator:servers"
+        self._tool_meta_index_key = "orchestrator:tool_meta_index"
+        # Deferred servers whose tools have not been discovered yet
+        self._pending_discovery: Set[str] = set()
+        self._discovery_locks: Dict[str, asyncio.Lock] = {}
+        # Failed deferred discoveries: name -> (consecutive failures, retry_at)
+        self._discovery_failures: Dict[str, Tuple[int, float]] = {}
     
     async def register(self, registration: ServerRegistration) -> ServerInfo:
         """Register a new MCP server."""
@@ -55,8 +111,9 @@ class ServerRegistry:
         if existing:
             raise ValueError(f"Server '{registration.name}' already registered")
         
-        # Create server info
-        server_info = ServerInfo(
+        # Create server info; every field comes from the already-validated
+        # registration, so skip re-validating it
+        server_info = ServerInfo.model_construct(
             name=registration.name,
             url=registration.url,
             transport=registration.transport,
@@ -65,8 +122,9 @@ class ServerRegistry:
             env=registration.env,
             connection_mode=registration.connection_mode,
             auth_type=registration.auth.type,
+            expose_tools=registration.expose_tools,
             status="unknown",
-            registered_at=datetime.utcnow(),
+            registered_at=datetime.now(timezone.utc),
             tool_count=0
         )
         
@@ -74,7 +132,7 @@ class ServerRegistry:
         await self._storage.hset(
             self._servers_key,
             registration.name,
-            server_info.model_dump()
+            _SERVER_INFO_ADAPTER.dump_python(server_info, mode="json")
         )
         
         # Store auth config separately
@@ -82,7 +140,17 @@ class ServerRegistry:
             await self._storage.hset(
                 f"orchestrator:server:{registration.name}:auth",
                 "config",
-                registration.auth.model_dump()
+                _AUTH_ADAPTER.dump_python(registration.auth, mode="json")
+            )
+        
+        if registration.auto_discover and registration.loading_mode == "deferred":
+            self._pending_discovery.add(registration.name)
+        
+        self._list_cache = None
+        if self._cache_enabled:
+            self._server_cache[registration.name] = server_info
+            self._auth_cache[registration.name] = (
+                registration.auth if registration.auth.type != "none" else None
             )
         
         return server_info
@@ -96,6 +164,9 @@ class ServerRegistry:
         
         # Remove server info
         await self._storage.hdel(self._servers_key, name)
+        self._server_cache.pop(name, None)
+        self._list_cache = None
+        self._auth_cache.pop(name, None)
         
         # Remove auth config
         await self._storage.delete(f"orchestrator:server:{name}:auth")
@@ -106,22 +177,39 @@ class ServerRegistry:
         # Remove tool metadata
         await self.remove_tool_metadata(name)
         
+        self._pending_discovery.discard(name)
+        self._discovery_locks.pop(name, None)
+        self._discovery_failures.pop(name, None)
+        
         return True
     
     async def get(self, name: str) -> Optional[ServerInfo]:
         """Get server info by name."""
+        cached = self._server_cache.get(name)
+        if cached is not None:
+            return cached
+        
         data = await self._storage.hget(self._servers_key, name)
         if data:
-            return ServerInfo.model_validate(data)
+            server = _server_info_from_storage(data)
+            if self._cache_enabled:
+                self._server_cache[name] = server
+            return server
         return None
     
     async def list_all(self) -> List[ServerInfo]:
         """List all registered servers."""
+        if self._list_cache is not None:
+            return list(self._list_cache)
+        
         servers_data = await self._storage.hgetall(self._servers_key)
-        return [
-            ServerInfo.model_validate(data)
+        servers = tuple(
+            _server_info_from_storage(data)
             for data in servers_data.values()
-        ]
+        )
+        if self._cache_enabled:
+            self._list_cache = servers
+        return list(servers)
     
     async def update_status(
         self,
@@ -130,66 +218,135 @@ class ServerRegistry:
         error_message: Optional[str] = None
     ) -> bool:
         """Update server health status."""
-        server = await self.get(name)
-        if not server:
+        data = await self._storage.hget(self._servers_key, name)
+        if not data:
             return False
         
-        # Create updated server info
-        updated_data = server.model_dump()
+        # Patch the stored dict directly; no model round-trip is needed
+        updated_data = dict(data)
         updated_data["status"] = status
-        updated_data["last_health_check"] = datetime.utcnow().isoformat()
+        updated_data["last_health_check"] = datetime.now(timezone.utc).isoformat()
         if error_message:
             updated_data["error_message"] = error_message
         
-        updated_server = ServerInfo.model_validate(updated_data)
-        
-        await self._storage.hset(
-            self._servers_key,
-            name,
-            updated_server.model_dump()
-        )
+        await self._storage.hset(self._servers_key, name, updated_data)
+        self._server_cache.pop(name, None)
+        self._list_cache = None
         return True
     
     async def update_tool_count(self, name: str, count: int) -> bool:
         """Update server tool count."""
-        server = await self.get(name)
-        if not server:
+        data = await self._storage.hget(self._servers_key, name)
+        if not data:
             return False
         
-        server.tool_count = count
-        await self._storage.hset(
-            self._servers_key,
-            name,
-            server.model_dump()
-        )
+        updated_data = dict(data)
+        updated_data["tool_count"] = count
+        
+        await self._storage.hset(self._servers_key, name, updated_data)
+        self._server_cache.pop(name, None)
+        self._list_cache = None
         return True
     
+    def _discovery_backing_off(self, name: str) -> bool:
+        """Whether a failed deferred discovery is still waiting to be retried."""
+        failure = self._discovery_failures.get(name)
+        return failure is not None and time.monotonic() < failure[1]
+    
+    def pending_discovery(self) -> List[str]:
+        """Deferred servers whose tools have not been discovered yet.
+        
+        Servers backing off after a failed discovery are left out until
+        their retry time.
+        """
+        return [
+            name for name in self._pending_discovery
+            if not self._discovery_backing_off(name)
+        ]
+    
+    async def ensure_discovered(
+        self,
+        name: str,
+        discover: Callable[[ServerInfo], Awaitable[List[Dict]]],
+    ) -> Optional[List[Dict]]:
+        """Run tool discovery for a deferred server on first use.
+        
+        Discovery runs at most once per server; concurrent callers wait for
+        the first one to finish. A failed discovery marks the server as
+        "error" and is not retried until an exponential backoff elapses, so
+        one unreachable server does not stall every search.
+        
+        Args:
+            name: Server name
+            discover: Coroutine function that lists tools for a ServerInfo
+        
+        Returns:
+            The newly discovered tools, or None if no discovery was needed
+            or the server is backing off after a failure
+        """
+        if name not in self._pending_discovery or self._discovery_backing_off(name):
+            return None
+        
+        lock = self._discovery_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name not in self._pending_discovery or self._discovery_backing_off(name):
+                return None
+            
+            server = await self.get(name)
+            if not server:
+                self._pending_discovery.discard(name)
+                return None
+            
+            try:
+                tools = await discover(server)
+            except Exception as e:
+                failures = self._discovery_failures.get(name, (0, 0.0))[0] + 1
+                delay = min(_DISCOVERY_RETRY_BASE * 2 ** (failures - 1), _DISCOVERY_RETRY_MAX)
+                self._discovery_failures[name] = (failures, time.monotonic() + delay)
+                await self.update_status(name, "error", str(e))
+                raise
+            
+            await self.store_tools(name, tools)
+            await self.update_tool_count(name, len(tools))
+            self._pending_discovery.discard(name)
+            self._discovery_failures.pop(name, None)
+            return tools
+    
     async def get_auth_config(self, name: str) -> Optional[AuthConfig]:
         """Get auth config for a server."""
+        if name in self._auth_cache:
+            return self._auth_cache[name]
+        
         data = await self._storage.hget(
             f"orchestrator:server:{name}:auth",
             "config"
         )
-        if data:
-            return AuthConfig.model_validate(data)
-        return None
+        # Written by register() from a validated AuthConfig
+        auth_config = AuthConfig.model_construct(**data) if data else None
+        if self._cache_enabled:
+            self._auth_cache[name] = auth_config
+        return auth_config
     
     async def store_tools(self, name: str, tools: List[Dict]) -> None:
         """Store tools for a server and their metadata.
         
-        Stores both the full tools list and individual metadata entries.
+        Stores both the full tools list and individual metadata entries
+        in a single batched write.
         """
-        # Store the full tools list
-        await self._storage.set(
-            f"orchestrator:server:{name}:tools",
-            tools
-        )
+        # Build the whole payload synchronously, then hand it over in one call
+        entries = [
+            self._build_tool_metadata(name, tool["name"], tool)
+            for tool in tools
+            if tool.get("name")
+        ]
+        namespaced_names = [meta["namespaced_name"] for meta in entries]
+        metadata = {
+            _TOOL_META_PREFIX + namespaced: meta
+            for namespaced, meta in zip(namespaced_names, entries)
+        }
         
-        # Store metadata for each tool
-        for tool in tools:
-            tool_name = tool.get("name")
-            if tool_name:
-                await self.store_tool_metadata(name, tool_name, tool)
+        await self._storage.mset({f"orchestrator:server:{name}:tools": tools, **metadata})
+        await self._storage.sadd(self._tool_meta_index_key, *namespaced_names)
     
     async def get_tools(self, name: str) -> List[Dict]:
         """Get tools for a server."""
@@ -210,15 +367,27 @@ class ServerRegistry:
         
         Storage key format: tool_meta:{server_name}__{tool_name}
         """
-        namespaced_name = f"{server_name}__{tool_name}"
-        metadata = {
-            "namespaced_name": namespaced_name,
+        metadata = self._build_tool_metadata(server_name, tool_name, tool_data)
+        await self._storage.set(
+            _TOOL_META_PREFIX + metadata["namespaced_name"],
+            metadata
+        )
+        await self._storage.sadd(self._tool_meta_index_key, metadata["namespaced_name"])
+    
+    def _build_tool_metadata(
+        self,
+        server_name: str,
+        tool_name: str,
+        tool_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the stored metadata entry for a single tool."""
+        return {
+            "namespaced_name": f"{server_name}__{tool_name}",
             "server_name": server_name,
             "tool_name": tool_name,
             "description": tool_data.get("description", ""),
             "input_schema": tool_data.get("input_schema", {}),
         }
-        await self._storage.set(f"orchestrator:tool_meta:{namespaced_name}", metadata)
     
     async def get_tool_metadata(
         self,
@@ -227,31 +396,54 @@ class ServerRegistry:
         """Retrieve stored metadata for a tool by its namespaced name.
         Returns None if not found.
         """
-        metadata = await self._storage.get(f"orchestrator:tool_meta:{namespaced_name}")
+        metadata = await self._storage.get(_TOOL_META_PREFIX + namespaced_name)
         return metadata
     
+    async def get_tool_metadata_many(
+        self, namespaced_names: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve stored metadata for several tools in one batched read.
+        Returns None for each name that is not found.
+        """
+        if not namespaced_names:
+            return []
+        return await self._storage.mget([_TOOL_META_PREFIX + n for n in namespaced_names])
+    
     async def get_all_tool_metadata(self) -> List[Dict[str, Any]]:
         """Return metadata for ALL tools across ALL servers.
         Each entry must include: namespaced_name, description, input_schema, server_name.
         Used by the search index to build/rebuild the corpus.
         """
-        # Scan for all tool metadata keys
-        all_metadata = []
-        pattern = "orchestrator:tool_meta:*"
-        
-        # Get all keys matching the pattern
-        keys = await self._storage.keys(pattern)
+        # Read the index set instead of scanning the keyspace
+        names = await self._storage.smembers(self._tool_meta_index_key)
+        if not names:
+            return []
         
-        for key in keys:
-            metadata = await self._storage.get(key)
-            if metadata:
-                all_metadata.append(metadata)
-        
-        return all_metadata
+        values = await self._storage.mget(
+            [_TOOL_META_PREFIX + n for n in names]
+        )
+        return [metadata for metadata in values if metadata]
     
     async def remove_tool_metadata(self, server_name: str) -> None:
         """Remove all tool metadata for a server."""
-        pattern = f"orchestrator:tool_meta:{server_name}__*"
-        keys = await self._storage.keys(pattern)
-        for key in keys:
-            await self._storage.delete(key)
+        prefix = f"{server_name}__"
+        candidates = [
+            n for n in await self._storage.smembers(self._tool_meta_index_key)
+            if n.startswith(prefix)
+        ]
+        if not candidates:
+            return
+        
+        # The prefix also matches servers whose names extend this one
+        # ("api" vs "api__v2"), so confirm ownership from the stored entry.
+        # Entries whose metadata is already gone are dropped as stale.
+        metadata = await self._storage.mget([_TOOL_META_PREFIX + n for n in candidates])
+        names = [
+            n for n, meta in zip(candidates, metadata)
+            if meta is None or meta.get("server_name") == server_name
+        ]
+        if not names:
+            return
+        
+        await self._storage.delete_many([_TOOL_META_PREFIX + n for n in names])
+        await self._storage.srem(self._tool_meta_index_key, *names)
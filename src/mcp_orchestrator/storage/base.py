@@ -1,9 +1,18 @@
 """Storage backends for MCP Orchestrator."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List, Mapping, Set
 import json
 
+# Prefer orjson for value (de)serialization when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 class StorageBackend(ABC):
     """Abstract storage interface."""
@@ -18,21 +27,46 @@ class StorageBackend(ABC):
         """Set value by key with optional TTL."""
         pass
     
+    @abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in a single operation, in key order."""
+        pass
+    
+    @abstractmethod
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set multiple values in a single operation with optional TTL."""
+        pass
+    
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete value by key. Returns True if deleted."""
         pass
     
+    @abstractmethod
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple keys in a single operation. Returns number deleted."""
+        pass
+    
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
         pass
     
+    @abstractmethod
+    async def exists_many(self, keys: List[str]) -> int:
+        """Count how many of the given keys exist."""
+        pass
+    
     @abstractmethod
     async def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         pass
     
+    @abstractmethod
+    def iter_keys(self, pattern: str = "*") -> AsyncIterator[str]:
+        """Iterate over keys matching pattern without materializing a list."""
+        pass
+    
     @abstractmethod
     async def hget(self, key: str, field: str) -> Optional[Any]:
         """Get hash field value."""
@@ -44,8 +78,17 @@ class StorageBackend(ABC):
         pass
     
     @abstractmethod
-    async def hgetall(self, key: str) -> Dict[str, Any]:
-        """Get all hash fields and values."""
+    async def hgetall(self, key: str) -> Mapping[str, Any]:
+        """Get all hash fields and values.
+        
+        The result may be a live read-only view; use hgetall_copy for a
+        snapshot that can be mutated or kept across writes.
+        """
+        pass
+    
+    @abstractmethod
+    async def hgetall_copy(self, key: str) -> Dict[str, Any]:
+        """Get a mutable snapshot of all hash fields and values."""
         pass
     
     @abstractmethod
@@ -53,6 +96,21 @@ class StorageBackend(ABC):
         """Delete hash field. Returns True if deleted."""
         pass
     
+    @abstractmethod
+    async def sadd(self, key: str, *members: str) -> int:
+        """Add members to a set. Returns number of new members."""
+        pass
+    
+    @abstractmethod
+    async def srem(self, key: str, *members: str) -> int:
+        """Remove members from a set. Returns number removed."""
+        pass
+    
+    @abstractmethod
+    async def smembers(self, key: str) -> Set[str]:
+        """Get all members of a set."""
+        pass
+    
     @abstractmethod
     async def close(self) -> None:
         """Close storage connection."""
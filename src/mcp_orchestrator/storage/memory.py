@@ -1,37 +1,78 @@
 """In-memory storage backend."""
 
+import fnmatch
+import functools
+import heapq
+import re
 import time
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Optional, Dict, Any, List, Mapping, Set, Tuple
 from .base import StorageBackend
 
 
+_EMPTY_HASH: Mapping[str, Any] = MappingProxyType({})
+
+# Max expired entries reclaimed per TTL write (cf. Redis active expiry)
+_WRITE_CLEANUP_BUDGET = 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Translate a glob pattern to a compiled regex matcher, once per pattern."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
 class InMemoryStorage(StorageBackend):
     """In-memory storage backend with TTL support."""
     
     def __init__(self):
         self._data: Dict[str, Any] = {}
         self._expires: Dict[str, float] = {}
+        # Min-heap of (expire_at, key). Entries are never removed on
+        # overwrite; a popped entry only counts if it still matches _expires.
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._hashes: Dict[str, Dict[str, Any]] = {}
+        self._sets: Dict[str, Set[str]] = {}
     
-    def _is_expired(self, key: str) -> bool:
-        """Check if key is expired."""
-        if key in self._expires:
-            if time.time() > self._expires[key]:
-                self._data.pop(key, None)
-                self._expires.pop(key, None)
-                return True
+    def _is_expired(self, key: str, now: Optional[float] = None) -> bool:
+        """Check if key is expired, purging it if so.
+        
+        Batch callers pass ``now`` so the clock is read once per batch.
+        """
+        expire_at = self._expires.get(key)
+        if expire_at is None:
+            return False
+        if (time.monotonic() if now is None else now) > expire_at:
+            self._data.pop(key, None)
+            del self._expires[key]
+            return True
         return False
     
-    def _cleanup_expired(self):
-        """Remove all expired keys."""
-        current_time = time.time()
-        expired = [
-            key for key, exp in self._expires.items()
-            if current_time > exp
-        ]
-        for key in expired:
-            self._data.pop(key, None)
-            self._expires.pop(key, None)
+    def _cleanup_expired(self, budget: Optional[int] = None):
+        """Remove expired keys, popping only due entries off the heap.
+        
+        With a ``budget``, at most that many heap entries are examined so
+        callers on the write path pay a bounded cost per call.
+        """
+        heap = self._expiry_heap
+        if not heap:
+            return
+        if not self._expires:
+            # Only stale entries remain; drop them without popping one by one
+            heap.clear()
+            return
+        now = time.monotonic()
+        expires = self._expires
+        pop_data = self._data.pop
+        heappop = heapq.heappop
+        remaining = len(heap) if budget is None else budget
+        while remaining and heap and heap[0][0] < now:
+            remaining -= 1
+            expire_at, key = heappop(heap)
+            # Skip stale entries left behind by overwrites and deletes
+            if expires.get(key) == expire_at:
+                pop_data(key, None)
+                del expires[key]
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value by key."""
@@ -43,58 +84,134 @@ class InMemoryStorage(StorageBackend):
         """Set value by key with optional TTL."""
         self._data[key] = value
         if ttl:
-            self._expires[key] = time.time() + ttl
+            expire_at = time.monotonic() + ttl
+            self._expires[key] = expire_at
+            heapq.heappush(self._expiry_heap, (expire_at, key))
+            # Reclaim keys that expired without ever being read again
+            self._cleanup_expired(_WRITE_CLEANUP_BUDGET)
         else:
             self._expires.pop(key, None)
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in a single operation."""
+        now = time.monotonic()
+        data = self._data
+        is_expired = self._is_expired
+        return [None if is_expired(key, now) else data.get(key) for key in keys]
+    
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set multiple values in a single operation with optional TTL."""
+        self._data.update(mapping)
+        if ttl:
+            expire_at = time.monotonic() + ttl
+            for key in mapping:
+                self._expires[key] = expire_at
+                heapq.heappush(self._expiry_heap, (expire_at, key))
+            self._cleanup_expired(_WRITE_CLEANUP_BUDGET)
+        else:
+            for key in mapping:
+                self._expires.pop(key, None)
+    
     async def delete(self, key: str) -> bool:
         """Delete value by key."""
         if key in self._data:
             del self._data[key]
             self._expires.pop(key, None)
             return True
+        # Like Redis DEL, also remove hashes stored under the key
+        if self._hashes.pop(key, None) is not None:
+            return True
         return False
     
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple keys in a single operation."""
+        deleted = 0
+        for key in keys:
+            if await self.delete(key):
+                deleted += 1
+        return deleted
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
         if self._is_expired(key):
             return False
         return key in self._data
     
+    async def exists_many(self, keys: List[str]) -> int:
+        """Count how many of the given keys exist."""
+        now = time.monotonic()
+        data = self._data
+        is_expired = self._is_expired
+        return sum(1 for key in keys if not is_expired(key, now) and key in data)
+    
     async def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         self._cleanup_expired()
         if pattern == "*":
-            return list(self._data.keys())
+            return list(self._data)
         
-        import fnmatch
-        return [k for k in self._data.keys() if fnmatch.fnmatch(k, pattern)]
+        match = _compile_pattern(pattern)
+        return [k for k in self._data if match(k)]
+    
+    async def iter_keys(self, pattern: str = "*") -> AsyncIterator[str]:
+        """Iterate over keys matching pattern."""
+        for key in await self.keys(pattern):
+            yield key
     
     async def hget(self, key: str, field: str) -> Optional[Any]:
         """Get hash field value."""
-        if key in self._hashes:
-            return self._hashes[key].get(field)
-        return None
+        fields = self._hashes.get(key)
+        return fields.get(field) if fields else None
     
     async def hset(self, key: str, field: str, value: Any) -> None:
         """Set hash field value."""
-        if key not in self._hashes:
-            self._hashes[key] = {}
-        self._hashes[key][field] = value
+        self._hashes.setdefault(key, {})[field] = value
+    
+    async def hgetall(self, key: str) -> Mapping[str, Any]:
+        """Get all hash fields and values.
+        
+        Returns a read-only view rather than a copy, so it reflects later
+        writes to the hash.
+        """
+        fields = self._hashes.get(key)
+        return MappingProxyType(fields) if fields is not None else _EMPTY_HASH
     
-    async def hgetall(self, key: str) -> Dict[str, Any]:
-        """Get all hash fields and values."""
+    async def hgetall_copy(self, key: str) -> Dict[str, Any]:
+        """Get a snapshot of all hash fields and values."""
         return self._hashes.get(key, {}).copy()
     
     async def hdel(self, key: str, field: str) -> bool:
         """Delete hash field."""
-        if key in self._hashes and field in self._hashes[key]:
-            del self._hashes[key][field]
+        fields = self._hashes.get(key)
+        if fields and field in fields:
+            del fields[field]
             return True
         return False
     
+    async def sadd(self, key: str, *members: str) -> int:
+        """Add members to a set."""
+        current = self._sets.setdefault(key, set())
+        before = len(current)
+        current.update(members)
+        return len(current) - before
+    
+    async def srem(self, key: str, *members: str) -> int:
+        """Remove members from a set."""
+        current = self._sets.get(key)
+        if not current:
+            return 0
+        before = len(current)
+        current.difference_update(members)
+        return before - len(current)
+    
+    async def smembers(self, key: str) -> Set[str]:
+        """Get all members of a set."""
+        return set(self._sets.get(key, ()))
+    
     async def close(self) -> None:
         """Close storage (no-op for memory)."""
         self._data.clear()
         self._expires.clear()
+        self._expiry_heap.clear()
         self._hashes.clear()
+        self._sets.clear()
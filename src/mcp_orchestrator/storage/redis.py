@@ -1,9 +1,15 @@
 """Redis storage backend."""
 
-import json
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Callable, Optional, Dict, Any, List, Set, Union
 import redis.asyncio as redis
-from .base import StorageBackend
+from .base import StorageBackend, _dumps, _loads
+
+
+def _deserialize_value(value: Optional[bytes]) -> Optional[Any]:
+    """Deserialize JSON to value, passing missing keys through as None."""
+    if value is None:
+        return None
+    return _loads(value)
 
 
 class RedisStorage(StorageBackend):
@@ -11,84 +17,144 @@ class RedisStorage(StorageBackend):
     
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
         self._redis_url = redis_url
-        self._redis: Optional[redis.Redis] = None
-    
-    async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
-        if self._redis is None:
-            self._redis = await redis.from_url(self._redis_url)
-        return self._redis
-    
-    def _serialize(self, value: Any) -> str:
-        """Serialize value to JSON string."""
-        return json.dumps(value)
-    
-    def _deserialize(self, value: Optional[bytes]) -> Optional[Any]:
-        """Deserialize JSON string to value."""
-        if value is None:
-            return None
-        return json.loads(value)
+        # Pool creation is synchronous and connects lazily, so build the
+        # client once here instead of checking for it on every call.
+        # Raw bytes are kept so values go straight to the JSON loader.
+        self._pool = redis.ConnectionPool.from_url(redis_url, decode_responses=False)
+        self._redis = redis.Redis(connection_pool=self._pool)
+        # Bound as plain attributes so each op skips method binding
+        self._serialize: Callable[[Any], Union[str, bytes]] = _dumps
+        self._deserialize: Callable[[Optional[bytes]], Optional[Any]] = _deserialize_value
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value by key."""
-        r = await self._get_redis()
+        r = self._redis
         value = await r.get(key)
         return self._deserialize(value)
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value by key with optional TTL."""
-        r = await self._get_redis()
+        r = self._redis
         serialized = self._serialize(value)
         if ttl:
             await r.setex(key, ttl, serialized)
         else:
             await r.set(key, serialized)
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values in a single round-trip."""
+        if not keys:
+            return []
+        r = self._redis
+        values = await r.mget(keys)
+        return [self._deserialize(v) for v in values]
+    
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set multiple values in a single round-trip.
+        
+        MSET has no expiry option, so TTL writes are batched through a
+        non-transactional pipeline instead.
+        """
+        if not mapping:
+            return
+        r = self._redis
+        if ttl:
+            pipe = r.pipeline(transaction=False)
+            for k, v in mapping.items():
+                pipe.set(k, self._serialize(v), ex=ttl)
+            await pipe.execute()
+        else:
+            await r.mset({k: self._serialize(v) for k, v in mapping.items()})
+    
     async def delete(self, key: str) -> bool:
         """Delete value by key."""
-        r = await self._get_redis()
-        result = await r.delete(key)
-        return result > 0
+        return bool(await self._redis.delete(key))
+    
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete multiple keys in a single round-trip."""
+        if not keys:
+            return 0
+        r = self._redis
+        return await r.delete(*keys)
     
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
-        r = await self._get_redis()
-        return await r.exists(key) > 0
+        return bool(await self._redis.exists(key))
+    
+    async def exists_many(self, keys: List[str]) -> int:
+        """Count how many of the given keys exist in a single round-trip."""
+        if not keys:
+            return 0
+        return await self._redis.exists(*keys)
     
     async def keys(self, pattern: str = "*") -> List[str]:
-        """Get keys matching pattern."""
-        r = await self._get_redis()
-        keys = await r.keys(pattern)
-        return [k.decode() if isinstance(k, bytes) else k for k in keys]
+        """Get keys matching pattern.
+        
+        Uses SCAN rather than KEYS so Redis is never blocked on a full
+        keyspace walk.
+        """
+        return [k async for k in self.iter_keys(pattern)]
+    
+    async def iter_keys(self, pattern: str = "*") -> AsyncIterator[str]:
+        """Iterate over keys matching pattern with a SCAN cursor."""
+        async for k in self._redis.scan_iter(match=pattern, count=500):
+            yield k.decode() if isinstance(k, bytes) else k
     
     async def hget(self, key: str, field: str) -> Optional[Any]:
         """Get hash field value."""
-        r = await self._get_redis()
+        r = self._redis
         value = await r.hget(key, field)
         return self._deserialize(value)
     
     async def hset(self, key: str, field: str, value: Any) -> None:
         """Set hash field value."""
-        r = await self._get_redis()
+        r = self._redis
         await r.hset(key, field, self._serialize(value))
     
     async def hgetall(self, key: str) -> Dict[str, Any]:
         """Get all hash fields and values."""
-        r = await self._get_redis()
+        r = self._redis
         result = await r.hgetall(key)
+        # Field values are never None here, so decode them directly
+        loads = _loads
         return {
-            k.decode() if isinstance(k, bytes) else k: self._deserialize(v)
+            k.decode() if isinstance(k, bytes) else k: loads(v)
             for k, v in result.items()
         }
     
+    async def hgetall_copy(self, key: str) -> Dict[str, Any]:
+        """Get a snapshot of all hash fields and values."""
+        # hgetall already builds a fresh dict per call
+        return await self.hgetall(key)
+    
     async def hdel(self, key: str, field: str) -> bool:
         """Delete hash field."""
-        r = await self._get_redis()
+        r = self._redis
         result = await r.hdel(key, field)
         return result > 0
     
+    async def sadd(self, key: str, *members: str) -> int:
+        """Add members to a set."""
+        if not members:
+            return 0
+        r = self._redis
+        return await r.sadd(key, *members)
+    
+    async def srem(self, key: str, *members: str) -> int:
+        """Remove members from a set."""
+        if not members:
+            return 0
+        r = self._redis
+        return await r.srem(key, *members)
+    
+    async def smembers(self, key: str) -> Set[str]:
+        """Get all members of a set."""
+        r = self._redis
+        members = await r.smembers(key)
+        return {m.decode() if isinstance(m, bytes) else m for m in members}
+    
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.close()
-            self._redis = None
+        """Close Redis connections."""
+        # The pool was passed in explicitly, so the client only closes it
+        # when asked to
+        await self._redis.aclose(close_connection_pool=True)
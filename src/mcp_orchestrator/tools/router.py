@@ -22,23 +22,125 @@ The router supports:
 - Schema caching for performance optimization
 """
 
+import contextlib
 import logging
-from typing import Optional, Dict, Any, List, Literal
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Iterator, List, Literal, Tuple, Callable, Awaitable, TypeVar
 from mcp import ClientSession
 from mcp.client.streamable_http import streamable_http_client
 from mcp.client.stdio import stdio_client, StdioServerParameters
+from urllib.parse import urlsplit
 import httpx
 import asyncio
+import anyio
 from cachetools import TTLCache
 
+# HTTP/2 needs the optional h2 package; without it clients stay on HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Errors that mean the stdio pipe or subprocess is gone, not that one request failed
+_STDIO_TRANSPORT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    EOFError,
+    OSError,
+)
+
+T = TypeVar("T")
+
+# Headers for the HTTP requests made by the current task. Pooled clients are
+# shared per origin, so per-caller headers such as forwarded auth tokens are
+# applied to each request instead of being baked into a client.
+_request_headers: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "_request_headers", default=None
+)
+
+
+@contextlib.contextmanager
+def request_headers(headers: Optional[Dict[str, str]]) -> Iterator[None]:
+    """Send ``headers`` with every pooled-client request made in this block.
+    
+    Tasks started inside the block (such as the MCP transport's writer)
+    inherit the headers; other callers sharing the client do not see them.
+    """
+    token = _request_headers.set(headers)
+    try:
+        yield
+    finally:
+        _request_headers.reset(token)
+
+
+async def _apply_request_headers(request: httpx.Request) -> None:
+    """httpx request hook that adds the calling task's headers."""
+    headers = _request_headers.get()
+    if headers:
+        request.headers.update(headers)
+
 
 class ToolCallError(Exception):
     """Raised when a tool call fails."""
     pass
 
 
+class _StdioSession:
+    """An initialized stdio MCP session kept open in its own task.
+    
+    ``stdio_client`` runs an anyio task group that must be exited by the task
+    that entered it, so the session cannot live in an exit stack shared by
+    whichever request happened to open it. A dedicated task holds the
+    context open until ``close()`` is called.
+    """
+    
+    def __init__(self, params: StdioServerParameters):
+        self.params = params
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        try:
+            async with stdio_client(self.params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self._ready.set_result(session)
+                    await self._stop.wait()
+        except asyncio.CancelledError:
+            if not self._ready.done():
+                self._ready.cancel()
+            raise
+        except Exception as e:
+            # Startup errors are delivered to waiters through the future;
+            # errors after startup just mark the session dead
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logger.debug("stdio session for '%s' ended: %s", self.params.command, e)
+    
+    @property
+    def alive(self) -> bool:
+        return not self._task.done()
+    
+    async def session(self) -> ClientSession:
+        """Wait for the session to finish its handshake."""
+        return await asyncio.shield(self._ready)
+    
+    async def close(self) -> None:
+        """Shut the session down and wait for the subprocess to exit."""
+        if self._ready.done():
+            self._stop.set()
+        else:
+            self._task.cancel()
+        with contextlib.suppress(Exception, asyncio.CancelledError):
+            await self._task
+
+
 class ToolRouter:
     """Routes tool calls to downstream MCP servers."""
     
@@ -60,9 +162,21 @@ class ToolRouter:
         self._timeout = timeout
         self._auth_mode = auth_mode
         self._transport = transport
-        # Cache for tool schemas: maps (server_name, tool_name) -> schema
+        # Auth mode and transport are fixed for the router's lifetime, so
+        # decide once whether client auth headers are forwarded. In "auto"
+        # mode they are forwarded only when the orchestrator serves HTTP.
+        self._forward_auth = auth_mode == "forward" or (
+            auth_mode == "auto" and transport == "http"
+        )
+        # Cache for tool schemas: maps (server_name, tool_name) tuples -> schema
         # TTL of 5 minutes, max 1000 entries
         self._schema_cache: TTLCache = TTLCache(maxsize=1000, ttl=cache_ttl)
+        # Pooled HTTP clients keyed by (scheme, host, timeout) so keep-alive
+        # connections are reused across tool calls; headers go per request
+        self._http_clients: Dict[Tuple[str, str, float], httpx.AsyncClient] = {}
+        # Long-lived stdio sessions keyed by server name so the subprocess
+        # and handshake are paid once rather than on every call
+        self._stdio_sessions: Dict[str, _StdioSession] = {}
     
     def cache_schema(self, server_name: str, tool_name: str, schema: Dict[str, Any]) -> None:
         """Cache a tool schema for later use.
@@ -72,9 +186,8 @@ class ToolRouter:
             tool_name: Name of the tool
             schema: Tool schema to cache
         """
-        key = f"{server_name}__{tool_name}"
-        self._schema_cache[key] = schema
-        logger.debug(f"Cached schema for {key}")
+        self._schema_cache[(server_name, tool_name)] = schema
+        logger.debug("Cached schema for %s__%s", server_name, tool_name)
     
     def get_cached_schema(self, server_name: str, tool_name: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached tool schema.
@@ -86,61 +199,184 @@ class ToolRouter:
         Returns:
             Cached schema if available, None otherwise
         """
-        key = f"{server_name}__{tool_name}"
-        schema = self._schema_cache.get(key)
+        schema = self._schema_cache.get((server_name, tool_name))
         if schema:
-            logger.debug(f"Cache hit for schema {key}")
+            logger.debug("Cache hit for schema %s__%s", server_name, tool_name)
         return schema
     
+    def get_cached_schemas(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve cached schemas for several tools at once.
+        
+        Args:
+            pairs: (server_name, tool_name) pairs to look up
+            
+        Returns:
+            Cached schema or None for each pair, in order
+        """
+        cache_get = self._schema_cache.get
+        return [cache_get(pair) for pair in pairs]
+    
+    async def prewarm(
+        self,
+        pairs: List[Tuple[str, str]],
+        registry: Any,  # ServerRegistry
+    ) -> None:
+        """Fill the schema cache for the given tools with one registry read.
+        
+        Args:
+            pairs: (server_name, tool_name) pairs to prewarm
+            registry: Server registry holding the stored tool metadata
+        """
+        missing = [
+            pair for pair, schema in zip(pairs, self.get_cached_schemas(pairs))
+            if schema is None
+        ]
+        if not missing:
+            return
+        
+        metadata = await registry.get_tool_metadata_many(
+            [f"{server_name}__{tool_name}" for server_name, tool_name in missing]
+        )
+        for (server_name, tool_name), meta in zip(missing, metadata):
+            if meta and meta.get("input_schema") is not None:
+                self.cache_schema(server_name, tool_name, meta["input_schema"])
+    
     def clear_cache(self) -> None:
         """Clear the schema cache."""
         self._schema_cache.clear()
         logger.debug("Schema cache cleared")
     
-    def _should_forward_auth(self, server_transport: str) -> bool:
-        """Determine if auth headers should be forwarded based on orchestrator auth mode.
+    def http_client(
+        self,
+        server_url: str,
+        timeout: Optional[float] = None,
+    ) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for a server origin and timeout.
+        
+        Clients are owned by the router and closed by ``close()``; callers
+        must not close them. Shared by tool calls and tool discovery. Use
+        ``request_headers()`` to send auth headers with a caller's requests.
         
         Args:
-            server_transport: Transport type of the downstream server
+            server_url: URL of the downstream server; only the origin is used
+            timeout: httpx timeout in seconds (default: the router's timeout).
+                Callers with a longer budget, such as discovery, get their own
+                pooled client instead of mutating a shared one.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        parts = urlsplit(server_url)
+        key = (parts.scheme, parts.netloc, timeout)
+        client = self._http_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                event_hooks={"request": [_apply_request_headers]},
+                # With HTTP/2 (negotiated over TLS), concurrent streams to one
+                # origin share a single connection
+                http2=_H2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=200,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._http_clients[key] = client
+        return client
+    
+    async def stdio_request(
+        self,
+        server_name: str,
+        params: StdioServerParameters,
+        request: Callable[[ClientSession], Awaitable[T]],
+    ) -> T:
+        """Run a request on the server's persistent stdio session.
+        
+        The session is opened on first use and reused afterwards. It is
+        respawned when the server's command line changes, the handshake
+        fails, the process exits, or a request hits a transport error. Tool
+        errors (``McpError``) and a caller's own timeout or cancellation
+        propagate without closing the session other callers share.
+        
+        Args:
+            server_name: Name of the downstream server
+            params: stdio parameters used to spawn the server
+            request: Coroutine function called with the initialized session
             
         Returns:
-            True if auth should be forwarded, False if static auth should be used
+            Whatever ``request`` returns
         """
-        if self._auth_mode == "static":
-            return False
-        elif self._auth_mode == "forward":
-            return True
-        else:  # "auto"
-            # If orchestrator is running in HTTP mode, forward auth
-            # If orchestrator is running in STDIO mode, use static auth
-            return self._transport == "http"
+        entry = self._stdio_sessions.get(server_name)
+        if entry is None or not entry.alive or entry.params != params:
+            if entry is not None:
+                await entry.close()
+            entry = _StdioSession(params)
+            self._stdio_sessions[server_name] = entry
+        
+        try:
+            session = await entry.session()
+        except asyncio.CancelledError:
+            # Only this caller gave up; the handshake is shielded for the rest
+            raise
+        except BaseException:
+            await self._discard_stdio_session(server_name, entry)
+            raise
+        
+        try:
+            return await request(session)
+        except _STDIO_TRANSPORT_ERRORS:
+            await self._discard_stdio_session(server_name, entry)
+            raise
+        except BaseException:
+            if not entry.alive:
+                await self._discard_stdio_session(server_name, entry)
+            raise
+    
+    async def _discard_stdio_session(self, server_name: str, entry: _StdioSession) -> None:
+        """Forget a broken stdio session so the next request respawns it."""
+        if self._stdio_sessions.get(server_name) is entry:
+            del self._stdio_sessions[server_name]
+        await entry.close()
+    
+    async def close_stdio_session(self, server_name: str) -> None:
+        """Close the persistent stdio session for a server, if any."""
+        entry = self._stdio_sessions.pop(server_name, None)
+        if entry is not None:
+            await entry.close()
+    
+    async def close(self) -> None:
+        """Close all pooled HTTP clients and stdio sessions."""
+        clients = list(self._http_clients.values())
+        self._http_clients.clear()
+        for client in clients:
+            await client.aclose()
+        
+        sessions = list(self._stdio_sessions.values())
+        self._stdio_sessions.clear()
+        for entry in sessions:
+            await entry.close()
     
     def _get_effective_auth_headers(
         self,
         server_auth_headers: Optional[Dict[str, str]],
         client_auth_header: Optional[str],
-        server_transport: str,
     ) -> Optional[Dict[str, str]]:
         """Get effective auth headers based on orchestrator auth mode.
         
         Args:
             server_auth_headers: Auth headers configured when registering the server
             client_auth_header: Auth header from the incoming client request
-            server_transport: Transport type of the downstream server
             
         Returns:
             Effective auth headers to use
         """
-        should_forward = self._should_forward_auth(server_transport)
-        
-        if should_forward and client_auth_header:
+        if self._forward_auth and client_auth_header:
             # Forward client auth header
             return {"Authorization": client_auth_header}
-        elif server_auth_headers:
-            # Use static server auth headers
-            return server_auth_headers
-        else:
-            return None
+        # Use static server auth headers
+        return server_auth_headers or None
     
     async def call_tool(
         self,
@@ -153,6 +389,7 @@ class ToolRouter:
         args: Optional[List[str]] = None,
         env: Optional[Dict[str, str]] = None,
         auth_headers: Optional[Dict[str, str]] = None,
+        client_auth_header: Optional[str] = None,
     ) -> Any:
         """Call a tool on a downstream MCP server.
         
@@ -171,12 +408,15 @@ class ToolRouter:
         Returns:
             Raw tool call result from remote server
         """
-        # Determine effective auth headers based on orchestrator auth mode
-        effective_auth = self._get_effective_auth_headers(
-            server_auth_headers=auth_headers,
-            client_auth_header=None,  # Will be passed from the tool call
-            server_transport=transport,
-        )
+        # Determine effective auth headers based on orchestrator auth mode;
+        # without a client header there is nothing to forward
+        if client_auth_header is None:
+            effective_auth = auth_headers or None
+        else:
+            effective_auth = self._get_effective_auth_headers(
+                server_auth_headers=auth_headers,
+                client_auth_header=client_auth_header,
+            )
         
         if transport == "http":
             return await self._call_tool_http(
@@ -231,10 +471,10 @@ class ToolRouter:
         if not (server_url.startswith("http://") or server_url.startswith("https://")):
             raise ToolCallError(f"Invalid HTTP URL for server '{server_name}': {server_url}")
         
-        logger.info(f"Calling tool '{tool_name}' on server '{server_name}' at {server_url}")
+        logger.info("Calling tool '%s' on server '%s' at %s", tool_name, server_name, server_url)
         
-        headers = auth_headers or {}
-        async with httpx.AsyncClient(headers=headers, timeout=self._timeout) as http_client:
+        http_client = self.http_client(server_url)
+        with request_headers(auth_headers):
             async with asyncio.timeout(self._timeout):
                 async with streamable_http_client(server_url, http_client=http_client) as (read, write, _get_session_id):
                     async with ClientSession(read, write) as session:
@@ -250,7 +490,7 @@ class ToolRouter:
         env: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Call a tool using stdio transport."""
-        logger.info(f"Calling tool '{tool_name}' on server '{server_name}' via stdio")
+        logger.info("Calling tool '%s' on server '%s' via stdio", tool_name, server_name)
         
         stdio_params = StdioServerParameters(
             command=command,
@@ -259,9 +499,12 @@ class ToolRouter:
         )
         
         async with asyncio.timeout(self._timeout):
-            async with stdio_client(stdio_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    return await self._execute_tool_call(session, tool_name, arguments)
+            result = await self.stdio_request(
+                server_name,
+                stdio_params,
+                lambda session: session.call_tool(tool_name, arguments),
+            )
+        return self._process_tool_result(result)
     
     def _process_tool_result(self, result: Any) -> Any:
         """Process the result from a tool call and return raw response."""
@@ -273,6 +516,7 @@ class ToolRouter:
         tool_name: str,
         arguments: Dict[str, Any],
         registry: Any,  # ServerRegistry
+        client_auth_header: Optional[str] = None,
     ) -> Any:
         """Call a tool using server info from the registry.
         
@@ -281,6 +525,7 @@ class ToolRouter:
             tool_name: Name of the tool to call
             arguments: Tool arguments
             registry: Server registry to look up server info
+            client_auth_header: Optional authentication header from client request
             
         Returns:
             Raw tool call result from remote server
@@ -305,4 +550,5 @@ class ToolRouter:
             args=server_info.args,
             env=server_info.env,
             auth_headers=auth_headers,
+            client_auth_header=client_auth_header,
         )
@@ -25,42 +25,96 @@ The service maintains an in-memory index of all tools and supports:
 - Fallback to regex when Whoosh is not available
 """
 
+import functools
+import heapq
+import math
 import re
+import string
+import sys
 import logging
-from typing import List, Dict, Any, Optional, Set
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import List, Dict, Any, FrozenSet, Optional, Set, Tuple
 from ..models import ToolReference
 
 logger = logging.getLogger(__name__)
 
 
 # Common English stop words to ignore in BM25 search
-STOP_WORDS: Set[str] = {
-    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'could', 'did', 'do',
-    'does', 'for', 'from', 'had', 'has', 'have', 'he', 'her', 'him', 'his', 'how',
-    'i', 'if', 'in', 'into', 'is', 'it', 'its', 'may', 'might', 'must', 'my',
-    'no', 'not', 'of', 'on', 'or', 'our', 'shall', 'she', 'should', 'so', 'some',
-    'such', 'than', 'that', 'the', 'their', 'them', 'then', 'there', 'these',
-    'they', 'this', 'those', 'to', 'too', 'was', 'we', 'were', 'what', 'when',
-    'where', 'which', 'who', 'whom', 'whose', 'will', 'with', 'would', 'you',
-    'your', 'get', 'me', 'myself', 'yourself', 'himself', 'herself', 'itself',
-    'ourselves', 'themselves', 'am', 'being', 'been', 'having', 'do', 'does',
-    'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because',
-    'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about',
-    'against', 'between', 'into', 'through', 'during', 'before', 'after',
-    'above', 'below', 'up', 'down', 'in', 'out', 'on', 'off', 'over',
-    'under', 'again', 'further', 'then', 'once', 'here', 'there',
-    'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
-    'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same',
-    'than', 'too', 'very', 'just', 'should', 'now'
+STOP_WORDS: FrozenSet[str] = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'could', 'did',
+    'do', 'does', 'for', 'from', 'had', 'has', 'have', 'he', 'her', 'him',
+    'his', 'how', 'i', 'if', 'in', 'into', 'is', 'it', 'its', 'may', 'might',
+    'must', 'my', 'no', 'not', 'of', 'on', 'or', 'our', 'shall', 'she',
+    'should', 'so', 'some', 'such', 'than', 'that', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'those', 'to', 'too', 'was', 'we',
+    'were', 'what', 'when', 'where', 'which', 'who', 'whom', 'whose', 'will',
+    'with', 'would', 'you', 'your', 'get', 'me', 'myself', 'yourself',
+    'himself', 'herself', 'itself', 'ourselves', 'themselves', 'am', 'being',
+    'been', 'having', 'doing', 'but', 'because', 'until', 'while', 'about',
+    'against', 'between', 'through', 'during', 'before', 'after', 'above',
+    'below', 'up', 'down', 'out', 'off', 'over', 'under', 'again', 'further',
+    'once', 'here', 'all', 'any', 'both', 'each', 'few', 'more', 'most',
+    'other', 'nor', 'only', 'own', 'same', 'very', 'just', 'now'
+})
+
+# Related terms that also count toward a query keyword, at reduced weight
+SEMANTIC_BOOSTS: Dict[str, FrozenSet[str]] = {
+    'search': frozenset({'query', 'find', 'lookup', 'fetch'}),
+    'query': frozenset({'search', 'find', 'lookup'}),
+    'documentation': frozenset({'docs', 'document', 'guide', 'reference', 'manual'}),
+    'docs': frozenset({'documentation', 'document', 'guide'}),
+    'library': frozenset({'package', 'module', 'dependency'}),
+    'mcp': frozenset({'model', 'context', 'protocol'}),
 }
 
+# Weight of a semantic equivalent relative to the keyword itself
+SEMANTIC_WEIGHT = 0.5
+
+# Whole words of 3+ letters; text is lowercased before matching
+_WORD_RE = re.compile(r'\b[a-z_]{3,}\b')
+
+# BM25 terms are runs of [a-z0-9], so snake_case names split into words.
+# Tokenizing maps every other byte to a space in one translate pass;
+# non-ASCII characters are first replaced with '?', which is also mapped.
+_TOKEN_KEEP = frozenset((string.ascii_lowercase + string.digits).encode())
+_TOKEN_TABLE = bytes(c if c in _TOKEN_KEEP else 0x20 for c in range(256))
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_keywords_cached(text: str) -> Tuple[str, ...]:
+    """Extract keywords from text, memoized since query strings recur."""
+    return tuple(w for w in _WORD_RE.findall(text.lower()) if w not in STOP_WORDS)
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into BM25 terms, dropping stop words and short words."""
+    words = text.lower().encode('ascii', 'replace').translate(_TOKEN_TABLE).decode('ascii')
+    return [w for w in words.split() if len(w) > 2 and w not in STOP_WORDS]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(query: str) -> re.Pattern:
+    """Compile a case-insensitive search pattern, once per distinct query."""
+    return re.compile(query, re.IGNORECASE)
+
 
 class ToolSearchService:
     """Service for searching tools across registered servers."""
     
     def __init__(self):
         self._tools: Dict[str, Dict[str, Any]] = {}  # namespaced_name -> tool data
-        self._bm25_index = None
+        # BM25 inverted index: term -> {namespaced_name: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}  # name -> its distinct terms
+        self._doc_len: Dict[str, int] = {}
+        self._total_len = 0
+        self._by_server: Dict[str, Set[str]] = defaultdict(set)  # server -> names
+        # First-insertion order of each name, so equal scores rank stably
+        self._doc_order: Dict[str, int] = {}
+        self._next_order = 0
+        self.k1 = 1.5
+        self.b = 0.75
         self._whoosh_available = False
         
         # Try to import whoosh for BM25 search
@@ -101,7 +155,7 @@ class ToolSearchService:
             parts.append(description)
         parts.append(description)
         
-        input_schema = tool_data.get("input_schema", {})
+        input_schema = tool_data.get("input_schema") or {}
         properties = input_schema.get("properties", {})
         
         for prop_name, prop_data in properties.items():
@@ -133,6 +187,56 @@ class ToolSearchService:
         """
         return self._build_searchable_text(tool, apply_weighting=True)
     
+    def _store(self, namespaced: str, tool_data: Dict[str, Any]) -> None:
+        """Add or replace a tool and keep the BM25 index in step."""
+        self._unindex(namespaced)
+        # Metadata entries are deserialized one by one; share one server name
+        tool_data["server_name"] = sys.intern(tool_data["server_name"])
+        previous = self._tools.get(namespaced)
+        if previous is not None:
+            self._by_server[previous["server_name"]].discard(namespaced)
+        self._by_server[tool_data["server_name"]].add(namespaced)
+        if namespaced not in self._doc_order:
+            self._doc_order[namespaced] = self._next_order
+            self._next_order += 1
+        
+        tokens = _tokenize(tool_data["searchable_text"])
+        counts = Counter(tokens)
+        # Intern distinct terms so every tool shares one string per term
+        terms = tuple(map(sys.intern, counts))
+        postings = self._postings
+        for term in terms:
+            postings[term][namespaced] = counts[term]
+        length = len(tokens)
+        self._doc_terms[namespaced] = terms
+        self._doc_len[namespaced] = length
+        self._total_len += length
+        # Built once here; searches hand out this shared, read-only instance.
+        # Every field was normalized by the index_* callers, so skip validation.
+        tool_data["ref"] = ToolReference.model_construct(
+            server_name=tool_data["server_name"],
+            tool_name=tool_data["tool_name"],
+            namespaced_name=tool_data["namespaced_name"],
+            description=tool_data["description"],
+            input_schema=tool_data["input_schema"],
+            defer_loading=tool_data["defer_loading"]
+        )
+        self._tools[namespaced] = tool_data
+    
+    def _unindex(self, namespaced: str) -> None:
+        """Drop a tool's postings from the BM25 index."""
+        terms = self._doc_terms.pop(namespaced, None)
+        if terms is None:
+            return
+        self._total_len -= self._doc_len.pop(namespaced)
+        postings = self._postings
+        for term in terms:
+            docs = postings.get(term)
+            if docs is not None:
+                docs.pop(namespaced, None)
+                if not docs:
+                    del postings[term]
+    
     def index_tool(self, server_name: str, tool: Dict[str, Any]) -> None:
         """Index a tool for searching."""
         tool_name = tool.get("name", "")
@@ -142,13 +246,13 @@ class ToolSearchService:
             "server_name": server_name,
             "tool_name": tool_name,
             "namespaced_name": namespaced,
-            "description": tool.get("description", ""),
-            "input_schema": tool.get("input_schema", {}),
+            "description": tool.get("description") or "",
+            "input_schema": tool.get("input_schema") or {},
             "searchable_text": self._extract_searchable_text(tool),
             "defer_loading": True
         }
         
-        self._tools[namespaced] = tool_data
+        self._store(namespaced, tool_data)
     
     def index_tools(self, server_name: str, tools: List[Dict[str, Any]]) -> None:
         """Index multiple tools from a server."""
@@ -169,13 +273,13 @@ class ToolSearchService:
             "server_name": tool_meta.get("server_name", ""),
             "tool_name": tool_meta.get("tool_name", ""),
             "namespaced_name": namespaced,
-            "description": tool_meta.get("description", ""),
-            "input_schema": tool_meta.get("input_schema", {}),
+            "description": tool_meta.get("description") or "",
+            "input_schema": tool_meta.get("input_schema") or {},
             "searchable_text": self._build_search_document(tool_meta),
             "defer_loading": True
         }
         
-        self._tools[namespaced] = tool_data
+        self._store(namespaced, tool_data)
     
     def index_all_metadata(self, metadata_list: List[Dict[str, Any]]) -> None:
         """Index all tools from a list of metadata entries."""
@@ -184,13 +288,10 @@ class ToolSearchService:
     
     def remove_server_tools(self, server_name: str) -> None:
         """Remove all tools from a server."""
-        prefix = f"{server_name}__"
-        to_remove = [
-            name for name in self._tools.keys()
-            if name.startswith(prefix)
-        ]
-        for name in to_remove:
+        for name in self._by_server.pop(server_name, ()):
             del self._tools[name]
+            self._unindex(name)
+            del self._doc_order[name]
     
     def search_regex(
         self,
@@ -199,112 +300,60 @@ class ToolSearchService:
     ) -> List[ToolReference]:
         """Search tools using regex pattern matching."""
         try:
-            pattern = re.compile(query, re.IGNORECASE)
+            pattern = _compile_pattern(query)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
         
-        results = []
-        for tool_data in self._tools.values():
-            searchable_text = tool_data.get("searchable_text", "")
-            if pattern.search(searchable_text):
-                results.append(ToolReference(
-                    server_name=tool_data["server_name"],
-                    tool_name=tool_data["tool_name"],
-                    namespaced_name=tool_data["namespaced_name"],
-                    description=tool_data["description"],
-                    input_schema=tool_data["input_schema"],
-                    defer_loading=tool_data["defer_loading"]
-                ))
-        
-        return results[:limit]
+        # Stop at the first `limit` hits instead of scanning every tool
+        search = pattern.search
+        hits = islice(
+            (t for t in self._tools.values() if search(t.get("searchable_text", ""))),
+            limit,
+        )
+        return [tool_data["ref"] for tool_data in hits]
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text, removing stop words."""
-        # Convert to lowercase and extract words
-        words = re.findall(r'\b[a-zA-Z_]+\b', text.lower())
-        # Filter out stop words and short words
-        return [w for w in words if w not in STOP_WORDS and len(w) > 2]
+        return list(_extract_keywords_cached(text))
     
-    def _calculate_bm25_score(self, query: str, tool_data: Dict[str, Any]) -> float:
-        """Calculate BM25-like relevance score with improved semantic weighting."""
-        query_keywords = self._extract_keywords(query)
-        if not query_keywords:
-            return 0.0
-        
-        tool_name = tool_data["tool_name"].lower()
-        description = tool_data.get("description", "").lower()
-        searchable_text = tool_data.get("searchable_text", "").lower()
-        
-        score = 0.0
-        name_matches = 0
-        desc_matches = 0
-        
-        for keyword in query_keywords:
-            # Name match (high priority)
-            if keyword in tool_name:
-                score += 8.0
-                name_matches += 1
-                # Extra boost if keyword appears at start of name
-                if tool_name.startswith(keyword):
-                    score += 4.0
-            
-            # Description match (VERY high priority - most important for semantic search)
-            if keyword in description:
-                # Give description matches much higher weight
-                score += 15.0
-                desc_matches += 1
-                # Extra boost if in first sentence/100 chars
-                if keyword in description[:100]:
-                    score += 5.0
-            
-            # Searchable text (params, etc) - lower weight
-            count = searchable_text.count(keyword)
-            if count > 0:
-                score += count * 0.5
-            
-            # Semantic equivalents boost
-            semantic_boosts = {
-                'search': ['query', 'find', 'lookup', 'fetch', 'get'],
-                'query': ['search', 'find', 'lookup'],
-                'documentation': ['docs', 'document', 'guide', 'reference', 'manual'],
-                'docs': ['documentation', 'document', 'guide'],
-                'library': ['package', 'module', 'dependency'],
-                'mcp': ['model', 'context', 'protocol'],
-            }
-            
-            # Check for semantic equivalents in name
-            if keyword in semantic_boosts:
-                for equiv in semantic_boosts[keyword]:
-                    if equiv in tool_name:
-                        score += 5.0
-                    if equiv in description:
-                        score += 8.0
-            
-            # Partial word matching (fuzzy)
-            name_words = tool_name.replace('_', ' ').replace('-', ' ').split()
-            desc_words = description.split()
-            
-            for word in name_words:
-                word = word.strip()
-                if len(word) > 3 and keyword in word and keyword != word:
-                    score += 2.0
-            
-            for word in desc_words:
-                word = word.strip('.,;:')
-                if len(word) > 3 and keyword in word and keyword != word:
-                    score += 1.0
+    def _query_weights(self, query: str) -> Dict[str, float]:
+        """Map query terms, plus their semantic equivalents, to weights."""
+        weights: Dict[str, float] = {}
+        terms = _tokenize(query)
+        for term in terms:
+            weights[term] = weights.get(term, 0.0) + 1.0
+        for term in terms:
+            for equiv in SEMANTIC_BOOSTS.get(term, ()):
+                if equiv not in weights:
+                    weights[equiv] = SEMANTIC_WEIGHT
+        return weights
+    
+    def _bm25_scores(self, query: str) -> Dict[str, float]:
+        """Okapi BM25 score for every tool sharing a term with the query.
         
-        # Strong boost if both name AND description have matches
-        if name_matches > 0 and desc_matches > 0:
-            score *= 2.0
-        # Boost if all keywords found in description (strong semantic match)
-        elif desc_matches >= len(query_keywords):
-            score *= 1.8
-        # Boost if most keywords matched
-        elif (name_matches + desc_matches) >= len(query_keywords) * 0.7:
-            score *= 1.4
+        score(D) = sum over terms t of
+            w(t) * idf(t) * tf(t, D) * (k1 + 1) / (tf(t, D) + k1 * (1 - b + b * |D| / avgdl))
+        with idf(t) = ln((N - df(t) + 0.5) / (df(t) + 0.5) + 1), which stays positive.
+        """
+        scores: Dict[str, float] = defaultdict(float)
+        n_docs = len(self._doc_terms)
+        if not n_docs:
+            return scores
         
-        return score
+        k1, b = self.k1, self.b
+        avgdl = (self._total_len / n_docs) or 1.0
+        doc_len = self._doc_len
+        for term, weight in self._query_weights(query).items():
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            df = len(docs)
+            idf = math.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+            term_weight = weight * idf * (k1 + 1)
+            for name, tf in docs.items():
+                norm = tf + k1 * (1 - b + b * doc_len[name] / avgdl)
+                scores[name] += term_weight * tf / norm
+        return scores
     
     def search_bm25(
         self,
@@ -313,7 +362,7 @@ class ToolSearchService:
     ) -> List[ToolReference]:
         """Search tools using BM25 relevance ranking."""
         query_keywords = self._extract_keywords(query)
-        logger.debug(f"BM25 search query: '{query}' -> keywords: {query_keywords}")
+        logger.debug("BM25 search query: '%s' -> keywords: %s", query, query_keywords)
         
         if not self._whoosh_available:
             # Use improved fallback with keyword extraction
@@ -323,34 +372,18 @@ class ToolSearchService:
                 return self.search_regex(pattern, limit)
             return []
         
-        # Calculate BM25-like scores for all tools
-        scored_results = []
-        
-        for tool_data in self._tools.values():
-            score = self._calculate_bm25_score(query, tool_data)
-            
-            if score > 0:
-                scored_results.append((score, tool_data))
-                logger.debug(f"Tool '{tool_data['tool_name']}' score: {score}")
-        
-        # Sort by score descending
-        scored_results.sort(key=lambda x: x[0], reverse=True)
+        scores = self._bm25_scores(query)
+        order = self._doc_order
+        top = heapq.nsmallest(
+            limit, scores.items(), key=lambda item: (-item[1], order[item[0]])
+        )
+        scored_results = [(score, self._tools[name]) for name, score in top]
         
-        # Log top results for debugging
-        if scored_results:
-            logger.debug(f"Top result: {scored_results[0][1]['tool_name']} (score: {scored_results[0][0]})")
+        if logger.isEnabledFor(logging.DEBUG):
+            for score, tool_data in scored_results:
+                logger.debug("Tool '%s' score: %s", tool_data['tool_name'], score)
         
-        return [
-            ToolReference(
-                server_name=tool_data["server_name"],
-                tool_name=tool_data["tool_name"],
-                namespaced_name=tool_data["namespaced_name"],
-                description=tool_data["description"],
-                input_schema=tool_data["input_schema"],
-                defer_loading=tool_data["defer_loading"]
-            )
-            for score, tool_data in scored_results[:limit]
-        ]
+        return [tool_data["ref"] for score, tool_data in scored_results]
     
     def search(
         self,
@@ -375,28 +408,11 @@ class ToolSearchService:
     
     def get_all_tools(self) -> List[ToolReference]:
         """Get all indexed tools."""
-        return [
-            ToolReference(
-                server_name=tool_data["server_name"],
-                tool_name=tool_data["tool_name"],
-                namespaced_name=tool_data["namespaced_name"],
-                description=tool_data["description"],
-                input_schema=tool_data["input_schema"],
-                defer_loading=tool_data["defer_loading"]
-            )
-            for tool_data in self._tools.values()
-        ]
+        return [tool_data["ref"] for tool_data in self._tools.values()]
     
     def get_tool(self, namespaced_name: str) -> Optional[ToolReference]:
         """Get a specific tool by namespaced name."""
         tool_data = self._tools.get(namespaced_name)
         if tool_data:
-            return ToolReference(
-                server_name=tool_data["server_name"],
-                tool_name=tool_data["tool_name"],
-                namespaced_name=tool_data["namespaced_name"],
-                description=tool_data["description"],
-                input_schema=tool_data["input_schema"],
-                defer_loading=tool_data["defer_loading"]
-            )
+            return tool_data["ref"]
         return None
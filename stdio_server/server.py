@@ -2,131 +2,163 @@
 
 import sys
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Union
 
+# Prefer orjson when it is installed; both paths read and write bytes
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
 
-def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle incoming MCP request."""
-    method = request.get("method")
-    
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id"),
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# A JSON-RPC response, either as a dict or already serialized
+Response = Union[Dict[str, Any], bytes]
+
+
+# The tool list never changes, so build it once and share it between
+# responses; responses are only serialized, never mutated
+_LIST_RESULT: Dict[str, Any] = {
+    "tools": [
+        {
+            "name": "echo",
+            "description": "Echo back the input",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string", "description": "Text to echo"}
                 },
-                "serverInfo": {
-                    "name": "test-stdio-server",
-                    "version": "1.0.0"
-                }
+                "required": ["text"]
             }
-        }
-    
-    elif method == "tools/list":
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id"),
-            "result": {
-                "tools": [
-                    {
-                        "name": "echo",
-                        "description": "Echo back the input",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "text": {"type": "string", "description": "Text to echo"}
-                            },
-                            "required": ["text"]
-                        }
-                    },
-                    {
-                        "name": "add",
-                        "description": "Add two numbers",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "a": {"type": "number", "description": "First number"},
-                                "b": {"type": "number", "description": "Second number"}
-                            },
-                            "required": ["a", "b"]
-                        }
-                    }
-                ]
+        },
+        {
+            "name": "add",
+            "description": "Add two numbers",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "a": {"type": "number", "description": "First number"},
+                    "b": {"type": "number", "description": "Second number"}
+                },
+                "required": ["a", "b"]
             }
         }
-    
-    elif method == "tools/call":
-        params = request.get("params", {})
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-        
-        if tool_name == "echo":
-            text = arguments.get("text", "")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": text
-                        }
-                    ]
-                }
-            }
-        
-        elif tool_name == "add":
-            a = arguments.get("a", 0)
-            b = arguments.get("b", 0)
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": str(a + b)
-                        }
-                    ]
-                }
-            }
-    
+    ]
+}
+
+
+def _result(request: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a result in a JSON-RPC response."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request.get("id"),
+        "result": result,
+    }
+
+
+def _method_not_found(request: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "jsonrpc": "2.0",
         "id": request.get("id"),
         "error": {
             "code": -32601,
-            "message": f"Method not found: {method}"
+            "message": f"Method not found: {request.get('method')}"
         }
     }
 
 
+def _handle_initialize(request: Dict[str, Any]) -> Dict[str, Any]:
+    return _result(request, {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {
+            "tools": {}
+        },
+        "serverInfo": {
+            "name": "test-stdio-server",
+            "version": "1.0.0"
+        }
+    })
+
+
+def _handle_tools_list(request: Dict[str, Any]) -> Dict[str, Any]:
+    return _result(request, _LIST_RESULT)
+
+
+# Tool implementations: arguments dict -> text content
+_TOOLS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "echo": lambda arguments: arguments.get("text", ""),
+    "add": lambda arguments: str(arguments.get("a", 0) + arguments.get("b", 0)),
+}
+
+
+# Tool results differ only in id and text, so they are written from fixed
+# byte fragments around those two JSON tokens instead of a nested dict
+_TEXT_RESULT_PREFIX = b'{"jsonrpc":"2.0","id":'
+_TEXT_RESULT_MIDDLE = b',"result":{"content":[{"type":"text","text":'
+_TEXT_RESULT_SUFFIX = b'}]}}'
+
+
+def _handle_tools_call(request: Dict[str, Any]) -> Response:
+    params = request.get("params", {})
+    tool = _TOOLS.get(params.get("name"))
+    if tool is None:
+        return _method_not_found(request)
+    
+    text = tool(params.get("arguments", {}))
+    return (
+        _TEXT_RESULT_PREFIX + _dumps(request.get("id"))
+        + _TEXT_RESULT_MIDDLE + _dumps(text)
+        + _TEXT_RESULT_SUFFIX
+    )
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Response]] = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+}
+
+
+def handle_request(request: Dict[str, Any]) -> Response:
+    """Handle incoming MCP request.
+    
+    Returns the response as a dict, or as already-serialized bytes.
+    """
+    return _HANDLERS.get(request.get("method"), _method_not_found)(request)
+
+
 def main():
     """Main STDIO loop."""
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
     while True:
         try:
-            line = sys.stdin.readline()
+            line = stdin.readline()
             if not line:
                 break
             
-            request = json.loads(line.strip())
+            request = _loads(line)
             response = handle_request(request)
             
-            print(json.dumps(response), flush=True)
+            if not isinstance(response, bytes):
+                response = _dumps(response)
+            stdout.write(response + b"\n")
+            stdout.flush()
             
         except json.JSONDecodeError:
             break
         except Exception as e:
-            print(json.dumps({
+            stdout.write(_dumps({
                 "jsonrpc": "2.0",
                 "error": {
                     "code": -32603,
                     "message": f"Internal error: {str(e)}"
                 }
-            }), flush=True)
+            }) + b"\n")
+            stdout.flush()
 
 
 if __name__ == "__main__":
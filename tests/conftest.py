@@ -0,0 +1,33 @@
+"""Shared test fixtures."""
+
+import asyncio
+import pytest
+
+
+SLOW_SERVER_DELAY = 0.5
+
+
+@pytest.fixture
+async def slow_http_url():
+    """URL of a local HTTP server that answers every request after a delay."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(SLOW_SERVER_DELAY)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: 2\r\n"
+                b"Connection: close\r\n\r\n{}"
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/mcp"
+    server.close()
+    await server.wait_closed()
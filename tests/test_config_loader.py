@@ -0,0 +1,95 @@
+"""Tests for server config loader."""
+
+import json
+import pytest
+from pydantic import ValidationError
+from mcp_orchestrator import config_loader
+from mcp_orchestrator.config_loader import ServerConfigLoader
+from mcp_orchestrator.mcp_server import MCPOrchestratorServer
+from mcp_orchestrator.models import ServerRegistration
+from mcp_orchestrator.server.registry import ServerRegistry
+from mcp_orchestrator.storage.memory import InMemoryStorage
+from mcp_orchestrator.tools.search import ToolSearchService
+
+
+def _entry(name: str, **kwargs):
+    return {"name": name, "url": f"https://{name}.example.com/mcp", "auto_discover": False, **kwargs}
+
+
+@pytest.fixture(params=["streaming", "json"])
+def loader_factory(request, tmp_path, monkeypatch):
+    """Build loaders for a config document, on both parsing paths."""
+    if request.param == "streaming":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(config_loader, "_IJSON_AVAILABLE", False)
+    
+    def make(document: str) -> ServerConfigLoader:
+        path = tmp_path / "server_config.json"
+        path.write_text(document)
+        return ServerConfigLoader(path)
+    
+    return make
+
+
+def test_iter_entries(loader_factory):
+    """Test that entries are read in file order around other top-level keys."""
+    document = json.dumps({
+        "servers": [_entry("one"), _entry("two", args=["--port", "8080"], env={"DEBUG": "1"})],
+        "version": "1.0",
+    })
+    entries = list(loader_factory(document)._iter_entries())
+    assert [e.name for e in entries] == ["one", "two"]
+
+
+def test_iter_entries_without_servers(loader_factory):
+    """Test that a document with no servers key has no entries."""
+    assert list(loader_factory("{}")._iter_entries()) == []
+
+
+@pytest.mark.parametrize("document", [
+    "[]",
+    '{"servers": {}}',
+    '{"servers": null}',
+    '{"version": 1, "servers": []}',
+    '{"servers": [{"url": "https://x.example.com"}]}',
+])
+def test_iter_entries_rejects_invalid_documents(loader_factory, document):
+    """Test that both parsing paths reject the same malformed documents."""
+    with pytest.raises(ValidationError):
+        list(loader_factory(document)._iter_entries())
+
+
+@pytest.mark.parametrize("document", ["", '{"servers": [', "{} trailing"])
+def test_iter_entries_rejects_invalid_json(loader_factory, document):
+    """Test that invalid JSON surfaces as ValueError."""
+    with pytest.raises(ValueError):
+        list(loader_factory(document)._iter_entries())
+
+
+def test_stream_yields_before_document_ends(tmp_path):
+    """Test that the streaming path hands out entries before parsing finishes."""
+    pytest.importorskip("ijson")
+    path = tmp_path / "server_config.json"
+    path.write_text(json.dumps({"servers": [_entry("one"), {"name": "broken"}]}))
+    
+    entries = ServerConfigLoader(path)._iter_entries()
+    assert next(entries).name == "one"
+    with pytest.raises(ValidationError):
+        next(entries)
+
+
+@pytest.mark.asyncio
+async def test_load_rolls_back_on_invalid_entry(loader_factory):
+    """Test that a config failing part way leaves no servers registered."""
+    storage = InMemoryStorage()
+    registry = ServerRegistry(storage)
+    tool_search = ToolSearchService()
+    mcp_server = MCPOrchestratorServer(storage, registry, tool_search)
+    await registry.register(ServerRegistration(name="existing", url="https://existing.example.com"))
+    
+    document = json.dumps({"servers": [_entry("new"), _entry("existing"), {"name": "broken"}]})
+    summary = await loader_factory(document).load_and_register(registry, tool_search, mcp_server)
+    
+    assert summary["servers_loaded"] == 0
+    assert [s.name for s in await registry.list_all()] == ["existing"]
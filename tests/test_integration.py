@@ -3,96 +3,249 @@ MCP Orchestrator Tool Call Validation - Final Version
 """
 
 import asyncio
+import contextvars
+import io
 import sys
-from pathlib import Path
 import httpx
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from mcp.client.streamable_http import streamable_http_client
-from mcp.client.stdio import stdio_client, StdioServerParameters
+from mcp.client.stdio import StdioServerParameters
 from mcp import ClientSession
 
+from mcp_orchestrator.mcp_server import MCPOrchestratorServer
+from mcp_orchestrator.models import ServerRegistration, AuthConfig
+from mcp_orchestrator.server.registry import ServerRegistry
+from mcp_orchestrator.storage.memory import InMemoryStorage
+from mcp_orchestrator.tools.router import ToolRouter
+from mcp_orchestrator.tools.search import ToolSearchService
+
+
+# Spawn the sample server with the interpreter running these checks (the
+# project venv under "uv run") instead of paying "uv run" per spawn
+STDIO_PARAMS = StdioServerParameters(
+    command=sys.executable,
+    args=["stdio_server/server.py"],
+    env={},
+)
+
+
+SAMPLE_HTTP_URL = "http://127.0.0.1:8000/mcp"
+SAMPLE_AUTH_HEADERS = {"Authorization": "Bearer sample-server-key"}
+
+# Registrations are fixed, so validate them once rather than per iteration
+_HTTP_REG = ServerRegistration(
+    name="http",
+    url=SAMPLE_HTTP_URL,
+    transport="http",
+    auth=AuthConfig(type="static", headers=SAMPLE_AUTH_HEADERS),
+    auto_discover=False,
+)
+_STDIO_REG = ServerRegistration(
+    name="stdio",
+    url="stdio_server/server.py",
+    transport="stdio",
+    command=STDIO_PARAMS.command,
+    args=STDIO_PARAMS.args,
+    auto_discover=False,
+)
+_SAMPLE_HTTP_REG = _HTTP_REG.model_copy(update={"name": "sample-http"})
+
+# Downstream name -> (registration, auth headers)
+REG_BY_NAME = {
+    "http": (_HTTP_REG, SAMPLE_AUTH_HEADERS),
+    "stdio": (_STDIO_REG, None),
+}
+
+# Per-call deadlines so a down server fails fast at the step that hangs,
+# instead of one blanket timeout around the whole check
+HANDSHAKE_DEADLINE = 5.0
+LIST_DEADLINE = 5.0
+CALL_DEADLINE = 20.0
+# Spawning the interpreter and completing the handshake
+STDIO_READY_DEADLINE = 10.0
+
+
+async def _session_ready(session: ClientSession) -> None:
+    """No-op request; reaching it means the session finished its handshake."""
+
+
+async def with_deadline(aw, seconds: float):
+    """Await ``aw``, raising TimeoutError after ``seconds``."""
+    return await asyncio.wait_for(aw, seconds)
+
+
+# Output buffer of the running phase; unset under pytest, where lines go
+# straight to stdout
+_phase_output: contextvars.ContextVar[io.StringIO] = contextvars.ContextVar("phase_output")
+
+
+def log(msg: str = "") -> None:
+    """Write a progress line to the current phase's buffer."""
+    out = _phase_output.get(None)
+    if out is None:
+        out = sys.stdout
+    out.write(msg + "\n")
+
+
+async def _buffered(coro):
+    """Run one phase with its output buffered, then write it in one go.
+
+    Each gathered phase (or case within a phase) runs in its own task and
+    so gets its own buffer, which keeps concurrent lines from interleaving.
+    """
+    parent = _phase_output.get(None)
+    buf = io.StringIO()
+    _phase_output.set(buf)
+    try:
+        return await coro
+    finally:
+        # Nested blocks land in the enclosing phase's buffer
+        if parent is not None:
+            parent.write(buf.getvalue())
+        else:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+
+
+def _make_router() -> ToolRouter:
+    """Router shared by the direct stdio and router checks.
+
+    One router for both transports: it pools HTTP clients per origin and
+    keeps stdio sessions open, so connections and subprocesses are reused.
+    """
+    return ToolRouter(timeout=30.0, auth_mode="auto", transport="http")
+
+
+def _make_http_client() -> httpx.AsyncClient:
+    """Client shared by the direct HTTP checks so keep-alive connections are reused."""
+    return httpx.AsyncClient(
+        headers={"Authorization": "Bearer sample-server-key"},
+        timeout=30.0,
+        # Phases run concurrently and may idle between calls for longer than
+        # httpx's 5s default expiry, so keep connections around for a minute
+        limits=httpx.Limits(
+            max_connections=20, max_keepalive_connections=20, keepalive_expiry=60.0
+        ),
+    )
+
+
+# Discovered tool lists are deterministic per downstream server, so the
+# phases share them instead of repeating list_tools round trips
+_discovery_cache: dict[tuple, list[dict]] = {}
+_discovery_locks: dict[tuple, asyncio.Lock] = {}
+
+
+async def _discover_cached(server, name, url, transport, command=None, args=None, auth_headers=None):
+    """Memoized server._discover_tools keyed by the downstream endpoint."""
+    key = (transport, url, command, tuple(args or ()))
+    async with _discovery_locks.setdefault(key, asyncio.Lock()):
+        tools = _discovery_cache.get(key)
+        if tools is None:
+            tools = await server._discover_tools(
+                name=name,
+                url=url,
+                transport=transport,
+                command=command,
+                args=args,
+                auth_headers=auth_headers,
+            )
+            _discovery_cache[key] = tools
+        return tools
+
+
+@pytest.fixture
+async def http_client():
+    async with _make_http_client() as client:
+        yield client
+
+
+@pytest.fixture
+async def router():
+    router = _make_router()
+    yield router
+    await router.close()
+
 
 @pytest.mark.skip(
     reason="Requires running MCP server - run manually for integration testing"
 )
-async def test_http_server():
+async def test_http_server(http_client: httpx.AsyncClient):
     """Test HTTP server."""
-    print("\n[1] Testing HTTP server (http://127.0.0.1:8000/mcp)")
-    headers = {"Authorization": "Bearer sample-server-key"}
+    log("\n[1] Testing HTTP server (http://127.0.0.1:8000/mcp)")
 
     try:
-        async with httpx.AsyncClient(headers=headers, timeout=30.0) as http_client:
-            async with streamable_http_client(
-                "http://127.0.0.1:8000/mcp", http_client=http_client
-            ) as (read, write, _get_session_id):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.list_tools()
-                    print(f"  Found {len(result.tools)} tools")
-
-                    # Test tool call
-                    call_result = await session.call_tool("add", {"a": 5, "b": 3})
-                    print(
-                        f"  add(5, 3) = {call_result.content[0].text if call_result.content else 'N/A'}"
-                    )
-                    return True
+        async with streamable_http_client(
+            "http://127.0.0.1:8000/mcp", http_client=http_client
+        ) as (read, write, _get_session_id):
+            async with ClientSession(read, write) as session:
+                await with_deadline(session.initialize(), HANDSHAKE_DEADLINE)
+                result = await with_deadline(session.list_tools(), LIST_DEADLINE)
+                log(f"  Found {len(result.tools)} tools")
+
+                # Test tool call
+                call_result = await with_deadline(
+                    session.call_tool("add", {"a": 5, "b": 3}), CALL_DEADLINE
+                )
+                log(
+                    f"  add(5, 3) = {call_result.content[0].text if call_result.content else 'N/A'}"
+                )
+                return True
     except Exception as e:
-        print(f"  ✗ Error: {type(e).__name__}: {e}")
+        log(f"  ✗ Error: {type(e).__name__}: {e}")
         return False
 
 
 @pytest.mark.skip(
     reason="Requires running MCP server - run manually for integration testing"
 )
-async def test_stdio_server():
+async def test_stdio_server(router: ToolRouter):
     """Test STDIO server."""
-    print("\n[2] Testing STDIO server")
+    log("\n[2] Testing STDIO server")
 
-    try:
-        stdio_params = StdioServerParameters(
-            command="uv",
-            args=["run", "python", "stdio_server/server.py"],
-            env={},
+    async def list_and_call(session: ClientSession) -> bool:
+        result = await with_deadline(session.list_tools(), LIST_DEADLINE)
+        log(f"  Found {len(result.tools)} tools")
+
+        # Test tool call
+        call_result = await with_deadline(
+            session.call_tool("echo", {"text": "test"}), CALL_DEADLINE
+        )
+        log(
+            f"  echo('test') = {call_result.content[0].text if call_result.content else 'N/A'}"
         )
 
-        async with asyncio.timeout(30):
-            async with stdio_client(stdio_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.list_tools()
-                    print(f"  Found {len(result.tools)} tools")
+        return True
 
-                    # Test tool call
-                    call_result = await session.call_tool("echo", {"text": "test"})
-                    print(
-                        f"  echo('test') = {call_result.content[0].text if call_result.content else 'N/A'}"
-                    )
+    try:
+        # Readiness probe: the router hands out the session only once the
+        # initialize handshake has completed, so a no-op request returns as
+        # soon as the server is ready, and one that never starts fails
+        # within the probe deadline rather than a blanket timeout
+        await with_deadline(
+            router.stdio_request("sample-stdio", STDIO_PARAMS, _session_ready),
+            STDIO_READY_DEADLINE,
+        )
 
-                    return True
+        # The router keeps the subprocess and its initialized session open,
+        # so this and test_router's stdio call reuse the probed session
+        return await router.stdio_request("sample-stdio", STDIO_PARAMS, list_and_call)
     except Exception as e:
-        print(f"  ✗ Error: {type(e).__name__}: {e}")
+        log(f"  ✗ Error: {type(e).__name__}: {e}")
         return False
 
 
 @pytest.mark.skip(
     reason="Requires running MCP server - run manually for integration testing"
 )
-async def test_router():
+async def test_router(router: ToolRouter):
     """Test the orchestrator's ToolRouter with HTTP and stdio transports."""
-    print("\n[3] Testing Orchestrator ToolRouter")
-
-    from mcp_orchestrator.tools.router import ToolRouter
+    log("\n[3] Testing Orchestrator ToolRouter")
 
     results = []
 
     # Test HTTP transport
-    print("  HTTP transport:")
-    router = ToolRouter(
-        timeout=30.0, auth_mode="auto", transport="http"
-    )
+    log("  HTTP transport:")
     result = await router.call_tool(
         server_name="sample-http",
         server_url="http://127.0.0.1:8000/mcp",
@@ -102,26 +255,23 @@ async def test_router():
         auth_headers={"Authorization": "Bearer sample-server-key"},
     )
     success = result.get("success", False)
-    print(f"    add(10, 20): {'✓' if success else '✗'}")
+    log(f"    add(10, 20): {'✓' if success else '✗'}")
     results.append(("http", success))
 
     # Test STDIO transport
-    print("  STDIO transport:")
-    router = ToolRouter(
-        timeout=30.0, auth_mode="auto", transport="stdio"
-    )
+    log("  STDIO transport:")
     result = await router.call_tool(
         server_name="sample-stdio",
         server_url="stdio_server/server.py",
         tool_name="echo",
         arguments={"text": "hello"},
         transport="stdio",
-        command="uv",
-        args=["run", "python", "stdio_server/server.py"],
-        env={},
+        command=STDIO_PARAMS.command,
+        args=STDIO_PARAMS.args,
+        env=STDIO_PARAMS.env,
     )
     success = result.get("success", False)
-    print(f"    echo('hello'): {'✓' if success else '✗'}")
+    log(f"    echo('hello'): {'✓' if success else '✗'}")
     results.append(("stdio", success))
 
     return results
@@ -132,130 +282,113 @@ async def test_router():
 )
 async def test_transports():
     """Test orchestrator with different transport modes."""
-    print("\n[4] Testing Orchestrator Transport Combinations")
-
-    from mcp_orchestrator.storage.memory import InMemoryStorage
-    from mcp_orchestrator.server.registry import ServerRegistry
-    from mcp_orchestrator.tools.search import ToolSearchService
-    from mcp_orchestrator.mcp_server import MCPOrchestratorServer
-    from mcp_orchestrator.models import ServerRegistration, AuthConfig
+    log("\n[4] Testing Orchestrator Transport Combinations")
 
     test_cases = [
         (
             "stdio",
             "stdio",
             "stdio_server/server.py",
-            "uv",
-            ["run", "python", "stdio_server/server.py"],
+            STDIO_PARAMS.command,
+            STDIO_PARAMS.args,
         ),
-        ("http", "http", "http://127.0.0.1:8000/mcp", None, None),
+        ("http", "http", SAMPLE_HTTP_URL, None, None),
     ]
 
-    results = []
-
-    for transport, downstream_name, downstream_url, cmd, args in test_cases:
-        print(f"\n  Orchestrator: {transport} -> Downstream: {downstream_name}")
+    # Cases register different downstream names, so they can share one
+    # storage, registry and search index
+    storage = InMemoryStorage()
+    registry = ServerRegistry(storage)
+    tool_search = ToolSearchService()
+
+    # Cases are independent, so run them concurrently; each buffers its own
+    # output so the lines of one case stay together
+    return list(await asyncio.gather(*(
+        _buffered(_run_case(storage, registry, tool_search, *case)) for case in test_cases
+    )))
+
+
+# Known tools with canned arguments, and sample values by JSON schema type
+# for building arguments for any other tool
+_PREFERRED_TOOLS = {"echo": {"text": "test"}, "get_time": {}}
+_SAMPLE_VALUES = {"string": "test", "number": 1}
+
+
+def _pick_tool(tools: list[dict]) -> tuple[str, dict]:
+    """Pick a tool to call - preferring echo, then get_time - and its arguments."""
+    by_name = {t.get("name", ""): t for t in tools}
+    for name, args in _PREFERRED_TOOLS.items():
+        if name in by_name:
+            return name, args
+
+    # Otherwise build args for the first tool from its schema
+    first = tools[0]
+    props = first.get("input_schema", {}).get("properties", {})
+    args = {
+        k: _SAMPLE_VALUES[v.get("type")]
+        for k, v in props.items()
+        if v.get("type") in _SAMPLE_VALUES
+    }
+    return first.get("name", ""), args
+
+
+async def _run_case(storage, registry, tool_search, transport, downstream_name, downstream_url, cmd, args):
+    """Run one orchestrator -> downstream transport combination."""
+    log(f"\n  Orchestrator: {transport} -> Downstream: {downstream_name}")
+
+    server = MCPOrchestratorServer(
+        storage=storage,
+        server_registry=registry,
+        tool_search=tool_search,
+        auth_mode="auto",
+        transport=transport,
+    )
 
-        storage = InMemoryStorage()
-        registry = ServerRegistry(storage)
-        tool_search = ToolSearchService()
+    reg, auth_headers = REG_BY_NAME[downstream_name]
 
-        server = MCPOrchestratorServer(
-            storage=storage,
-            server_registry=registry,
-            tool_search=tool_search,
-            auth_mode="auto",
-            transport=transport,
+    try:
+        await registry.register(reg)
+
+        # Discover tools
+        tools = await _discover_cached(
+            server,
+            name=downstream_name,
+            url=downstream_url,
+            transport=downstream_name,
+            command=cmd,
+            args=args,
+            auth_headers=auth_headers,
         )
 
-        # Build registration based on transport type
-        if downstream_name == "http":
-            reg = ServerRegistration(
-                name=downstream_name,
-                url=downstream_url,
-                transport=downstream_name,
-                auth=AuthConfig(
-                    type="static", headers={"Authorization": "Bearer sample-server-key"}
-                ),
-                auto_discover=False,
-            )
-            auth_headers = {"Authorization": "Bearer sample-server-key"}
-            tool_args = {"a": 1, "b": 2}
-        else:
-            reg = ServerRegistration(
-                name=downstream_name,
-                url=downstream_url,
-                transport="stdio",
-                command=cmd,
-                args=args,
-                auto_discover=False,
-            )
-            auth_headers = None
-            tool_args = {"text": "test"}
+        if tools:
+            await registry.store_tools(downstream_name, tools)
 
-        try:
-            await registry.register(reg)
+            first_tool, tool_args = _pick_tool(tools)
 
-            # Discover tools
-            tools = await server._discover_tools(
-                name=downstream_name,
-                url=downstream_url,
+            # Call tool via router
+            result = await server._tool_router.call_tool(
+                server_name=downstream_name,
+                server_url=downstream_url,
+                tool_name=first_tool,
+                arguments=tool_args,
                 transport=downstream_name,
                 command=cmd,
                 args=args,
                 auth_headers=auth_headers,
             )
 
-            if tools:
-                await registry.store_tools(downstream_name, tools)
-
-                # Find a suitable tool - prefer echo or get_time
-                first_tool = None
-                tool_args = {}
-                for t in tools:
-                    name = t.get("name", "")
-                    if name == "echo":
-                        first_tool = name
-                        tool_args = {"text": "test"}
-                        break
-                    elif name == "get_time":
-                        first_tool = name
-                        tool_args = {}
-                    elif first_tool is None:
-                        first_tool = name
-                        # Try to build args from schema
-                        schema = t.get("input_schema", {})
-                        props = schema.get("properties", {})
-                        for k, v in props.items():
-                            if v.get("type") == "string":
-                                tool_args[k] = "test"
-                            elif v.get("type") == "number":
-                                tool_args[k] = 1
-
-                # Call tool via router
-                result = await server._tool_router.call_tool(
-                    server_name=downstream_name,
-                    server_url=downstream_url,
-                    tool_name=first_tool,
-                    arguments=tool_args,
-                    transport=downstream_name,
-                    command=cmd,
-                    args=args,
-                    auth_headers=auth_headers,
-                )
-
-                success = result.get("success", False)
-                print(f"    Tool '{first_tool}': {'✓' if success else '✗'}")
-                results.append((transport, downstream_name, success))
-            else:
-                print(f"    No tools discovered")
-                results.append((transport, downstream_name, False))
-
-        except Exception as e:
-            print(f"    Error: {e}")
-            results.append((transport, downstream_name, False))
+            success = result.get("success", False)
+            log(f"    Tool '{first_tool}': {'✓' if success else '✗'}")
+            return transport, downstream_name, success
+        else:
+            log(f"    No tools discovered")
+            return transport, downstream_name, False
 
-    return results
+    except Exception as e:
+        log(f"    Error: {e}")
+        return transport, downstream_name, False
+    finally:
+        await server.close()
 
 
 @pytest.mark.skip(
@@ -263,75 +396,73 @@ async def test_transports():
 )
 async def test_call_remote_tool():
     """Test the call_remote_tool orchestrator tool."""
-    print("\n[5] Testing call_remote_tool Orchestrator Tool")
-
-    from mcp_orchestrator.storage.memory import InMemoryStorage
-    from mcp_orchestrator.server.registry import ServerRegistry
-    from mcp_orchestrator.tools.search import ToolSearchService
-    from mcp_orchestrator.mcp_server import MCPOrchestratorServer
-    from mcp_orchestrator.models import ServerRegistration, AuthConfig
-
-    results = []
-
-    for transport in ["http", "stdio"]:
-        print(f"\n  Orchestrator: {transport}")
-
-        storage = InMemoryStorage()
-        registry = ServerRegistry(storage)
-        tool_search = ToolSearchService()
-
-        server = MCPOrchestratorServer(
-            storage=storage,
-            server_registry=registry,
-            tool_search=tool_search,
-            auth_mode="auto",
-            transport=transport,
-        )
+    log("\n[5] Testing call_remote_tool Orchestrator Tool")
+
+    # Both orchestrator transports call the same downstream server, so
+    # register it once in shared storage
+    storage = InMemoryStorage()
+    registry = ServerRegistry(storage)
+    tool_search = ToolSearchService()
+    await registry.register(_SAMPLE_HTTP_REG)
+
+    # Orchestrator transports are independent, so check them concurrently
+    results = await asyncio.gather(*(
+        _buffered(_call_remote_tool_case(storage, registry, tool_search, transport))
+        for transport in ["http", "stdio"]
+    ))
+    return [result for case in results for result in case]
+
+
+async def _call_remote_tool_case(storage, registry, tool_search, transport):
+    """Call sample-http's add tool through an orchestrator on one transport."""
+    log(f"\n  Orchestrator: {transport}")
+
+    server = MCPOrchestratorServer(
+        storage=storage,
+        server_registry=registry,
+        tool_search=tool_search,
+        auth_mode="auto",
+        transport=transport,
+    )
 
-        # Register HTTP server
-        reg = ServerRegistration(
+    try:
+        # Discover tools
+        tools = await _discover_cached(
+            server,
             name="sample-http",
             url="http://127.0.0.1:8000/mcp",
             transport="http",
-            auth=AuthConfig(
-                type="static", headers={"Authorization": "Bearer sample-server-key"}
-            ),
-            auto_discover=False,
+            auth_headers={"Authorization": "Bearer sample-server-key"},
         )
 
-        try:
-            await registry.register(reg)
+        if tools:
+            await registry.store_tools("sample-http", tools)
 
-            # Discover tools
-            tools = await server._discover_tools(
-                name="sample-http",
-                url="http://127.0.0.1:8000/mcp",
+            # Use call_remote_tool
+            result = await server._tool_router.call_tool(
+                server_name="sample-http",
+                server_url="http://127.0.0.1:8000/mcp",
+                tool_name="add",
+                arguments={"a": 100, "b": 200},
                 transport="http",
                 auth_headers={"Authorization": "Bearer sample-server-key"},
             )
 
-            if tools:
-                await registry.store_tools("sample-http", tools)
-
-                # Use call_remote_tool
-                result = await server._tool_router.call_tool(
-                    server_name="sample-http",
-                    server_url="http://127.0.0.1:8000/mcp",
-                    tool_name="add",
-                    arguments={"a": 100, "b": 200},
-                    transport="http",
-                    auth_headers={"Authorization": "Bearer sample-server-key"},
-                )
+            success = result.get("success", False)
+            log(f"    add(100, 200): {'✓' if success else '✗'}")
+            return [(transport, success)]
 
-                success = result.get("success", False)
-                print(f"    add(100, 200): {'✓' if success else '✗'}")
-                results.append((transport, success))
+    except Exception as e:
+        log(f"    Error: {e}")
+        return [(transport, False)]
+    finally:
+        await server.close()
 
-        except Exception as e:
-            print(f"    Error: {e}")
-            results.append((transport, False))
+    return []
 
-    return results
+
+def _verdict(success: bool) -> str:
+    return "✓ PASS" if success else "✗ FAIL"
 
 
 async def main():
@@ -339,51 +470,65 @@ async def main():
     print("MCP Orchestrator Tool Call Validation")
     print("=" * 60)
 
-    # Test direct connections
-    http_ok = await test_http_server()
-    stdio_ok = await test_stdio_server()
-
-    # Test router
-    router_results = await test_router()
-
-    # Test orchestrator transports
-    orchestrator_results = await test_transports()
-
-    # Test call_remote_tool
-    call_results = await test_call_remote_tool()
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("VALIDATION SUMMARY")
-    print("=" * 60)
-
-    print("\n[Direct Server Connections]")
-    print(f"  HTTP (8000/mcp):    {'✓ PASS' if http_ok else '✗ FAIL'}")
-    print(f"  STDIO (subprocess): {'✓ PASS' if stdio_ok else '✗ FAIL'}")
-
-    print("\n[ToolRouter Direct]")
-    for transport, success in router_results:
-        print(f"  {transport}: {'✓ PASS' if success else '✗ FAIL'}")
-
-    print("\n[Orchestrator Transport Combinations]")
-    for gt, dt, success in orchestrator_results:
-        print(f"  {gt} -> {dt}: {'✓ PASS' if success else '✗ FAIL'}")
+    # The phases talk to independent servers and mostly wait on I/O, so run
+    # them together; each phase's output is written as one block when it
+    # finishes, and the summary below is printed in a fixed order
+    router = _make_router()
+    try:
+        async with _make_http_client() as http_client:
+            results = await asyncio.gather(
+                _buffered(test_http_server(http_client)),
+                _buffered(test_stdio_server(router)),
+                _buffered(test_router(router)),
+                _buffered(test_transports()),
+                _buffered(test_call_remote_tool()),
+                return_exceptions=True,
+            )
+    finally:
+        await router.close()
 
-    print("\n[call_remote_tool]")
-    for gt, success in call_results:
-        print(f"  {gt}: {'✓ PASS' if success else '✗ FAIL'}")
+    # A phase that raised counts as failed
+    http_ok, stdio_ok = (r is True for r in results[:2])
+    router_results, orchestrator_results, call_results = (
+        [] if isinstance(r, BaseException) else r for r in results[2:]
+    )
 
     # Calculate totals
-    all_tests = [http_ok, stdio_ok]
-    all_tests.extend([s for _, s in router_results])
-    all_tests.extend([s for _, _, s in orchestrator_results])
-    all_tests.extend([s for _, s in call_results])
+    all_tests = [
+        http_ok,
+        stdio_ok,
+        *(s for _, s in router_results),
+        *(s for _, _, s in orchestrator_results),
+        *(s for _, s in call_results),
+    ]
 
-    passed = sum(1 for s in all_tests if s)
+    passed = sum(all_tests)
     total = len(all_tests)
 
-    print(f"\n[TOTAL] {passed}/{total} tests passed ({100 * passed // total}%)")
-
+    # Summary, written as one block
+    rule = "=" * 60
+    summary = [
+        "",
+        rule,
+        "VALIDATION SUMMARY",
+        rule,
+        "",
+        "[Direct Server Connections]",
+        f"  HTTP (8000/mcp):    {_verdict(http_ok)}",
+        f"  STDIO (subprocess): {_verdict(stdio_ok)}",
+        "",
+        "[ToolRouter Direct]",
+        *(f"  {transport}: {_verdict(success)}" for transport, success in router_results),
+        "",
+        "[Orchestrator Transport Combinations]",
+        *(f"  {gt} -> {dt}: {_verdict(success)}" for gt, dt, success in orchestrator_results),
+        "",
+        "[call_remote_tool]",
+        *(f"  {gt}: {_verdict(success)}" for gt, success in call_results),
+        "",
+        f"[TOTAL] {passed}/{total} tests passed ({100 * passed // total}%)",
+    ]
+    print("\n".join(summary))
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,177 @@
+"""Tests for the orchestrator MCP server."""
+
+import asyncio
+import time
+import pytest
+from fastmcp import Client
+from mcp_orchestrator import mcp_server as mcp_server_module
+from mcp_orchestrator.mcp_server import MCPOrchestratorServer
+from mcp_orchestrator.models import ServerRegistration
+from mcp_orchestrator.server.registry import ServerRegistry
+from mcp_orchestrator.storage.memory import InMemoryStorage
+from mcp_orchestrator.tools.search import ToolSearchService
+
+
+def _make_server(**kwargs) -> MCPOrchestratorServer:
+    storage = InMemoryStorage()
+    return MCPOrchestratorServer(
+        storage, ServerRegistry(storage), ToolSearchService(), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_http_discovery_uses_discovery_timeout(slow_http_url, monkeypatch):
+    """Test that HTTP discovery is not cut off by the tool-call timeout."""
+    server = _make_server(discovery_timeout=5.0)
+    # Make the router's tool-call timeout shorter than the slow server
+    monkeypatch.setattr(server._tool_router, "_timeout", 0.1)
+    
+    async def list_tools_slowly(transport, server_name, url, http_client=None, stdio_params=None):
+        response = await http_client.get(url)
+        response.raise_for_status()
+        return [{"name": "slow_tool", "description": "", "input_schema": {}}]
+    
+    monkeypatch.setattr(server, "_discover_tools_with_session", list_tools_slowly)
+    try:
+        tools = await server._discover_tools_http("slow", slow_http_url)
+    finally:
+        await server._tool_router.close()
+    
+    assert [t["name"] for t in tools] == ["slow_tool"]
+
+
+@pytest.mark.asyncio
+async def test_failed_deferred_server_not_redialed_on_search(monkeypatch):
+    """Test that a deferred server whose discovery failed is skipped by later searches."""
+    server = _make_server()
+    await server._registry.register(ServerRegistration(
+        name="dead-server",
+        url="https://dead.example.com/mcp",
+        loading_mode="deferred",
+    ))
+    dialed = []
+    
+    async def discover_tools(name, **kwargs):
+        dialed.append(name)
+        raise ConnectionError("unreachable")
+    
+    monkeypatch.setattr(server, "_discover_tools", discover_tools)
+    async with Client(server._mcp) as client:
+        for _ in range(3):
+            result = await client.call_tool("tool_search", {"query": "weather"})
+            assert result.data["success"] is True
+    
+    assert dialed == ["dead-server"]
+
+
+@pytest.mark.asyncio
+async def test_dynamic_tool_keeps_parameter_schema():
+    """Test that exposed proxy tools advertise the downstream parameter schema."""
+    server = _make_server()
+    server._create_dynamic_tool("weather", "get_weather", {
+        "description": "Get weather",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string", "description": "City name"},
+                "units": {"type": "string", "enum": ["c", "f"]},
+                "days": {"type": "integer"},
+            },
+            "required": ["city"],
+        },
+    })
+    
+    async with Client(server._mcp) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+    schema = tools["weather__get_weather"].inputSchema
+    
+    assert schema["required"] == ["city"]
+    assert schema["properties"]["city"] == {"type": "string", "description": "City name"}
+    assert {"type": "string", "enum": ["c", "f"]} in schema["properties"]["units"]["anyOf"]
+    assert {"type": "integer"} in schema["properties"]["days"]["anyOf"]
+
+
+@pytest.mark.asyncio
+async def test_call_remote_tool_forwards_client_auth_header(monkeypatch):
+    """Test that the incoming request's Authorization header reaches the router."""
+    server = _make_server(transport="http")
+    await server._registry.register(ServerRegistration(
+        name="remote",
+        url="https://remote.example.com/mcp",
+    ))
+    monkeypatch.setattr(
+        mcp_server_module,
+        "get_http_headers",
+        lambda include_all=False: {"authorization": "Bearer client-token"},
+    )
+    calls = []
+    
+    async def call_tool(**kwargs):
+        calls.append(kwargs)
+        return {"ok": True}
+    
+    monkeypatch.setattr(server._tool_router, "call_tool", call_tool)
+    async with Client(server._mcp) as client:
+        await client.call_tool("call_remote_tool", {"tool_name": "remote__echo"})
+        await client.call_tool(
+            "call_remote_tool", {"tool_name": "remote__echo", "auth_header": "Bearer explicit"}
+        )
+    
+    assert calls[0]["client_auth_header"] == "Bearer client-token"
+    # An explicit auth_header argument wins over the forwarded one
+    assert calls[1]["client_auth_header"] is None
+    assert calls[1]["auth_headers"] == {"Authorization": "Bearer explicit"}
+
+
+@pytest.mark.asyncio
+async def test_deferred_server_exposes_tools_after_discovery(monkeypatch):
+    """Test that expose_tools takes effect once a deferred server is discovered."""
+    server = _make_server()
+    await server._registry.register(ServerRegistration(
+        name="lazy",
+        url="https://lazy.example.com/mcp",
+        loading_mode="deferred",
+        expose_tools=True,
+    ))
+    
+    async def discover_tools(name, **kwargs):
+        return [{"name": "forecast", "description": "Weather forecast", "input_schema": {}}]
+    
+    monkeypatch.setattr(server, "_discover_tools", discover_tools)
+    async with Client(server._mcp) as client:
+        await client.call_tool("tool_search", {"query": "forecast"})
+        names = {tool.name for tool in await client.list_tools()}
+    
+    assert "lazy__forecast" in names
+
+
+@pytest.mark.asyncio
+async def test_slow_deferred_discovery_does_not_block_search(monkeypatch):
+    """Test that search answers from indexed tools while a slow server is discovered."""
+    server = _make_server()
+    await server._registry.register(ServerRegistration(
+        name="slow",
+        url="https://slow.example.com/mcp",
+        loading_mode="deferred",
+    ))
+    monkeypatch.setattr(mcp_server_module, "_SEARCH_DISCOVERY_WAIT", 0.1)
+    
+    async def discover_tools(name, **kwargs):
+        await asyncio.sleep(30)
+        return []
+    
+    monkeypatch.setattr(server, "_discover_tools", discover_tools)
+    try:
+        async with Client(server._mcp) as client:
+            started = time.monotonic()
+            result = await client.call_tool("tool_search", {"query": "weather"})
+            assert result.data["success"] is True
+            assert time.monotonic() - started < 5
+            # Later searches don't start a second discovery of the same server
+            task = server._discovery_tasks["slow"]
+            await client.call_tool("tool_search", {"query": "weather"})
+            assert server._discovery_tasks["slow"] is task
+    finally:
+        await server.close()
+    
+    assert server._discovery_tasks == {}
@@ -1,8 +1,11 @@
 """Tests for server registry."""
 
+import time
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from mcp_orchestrator.models import ServerRegistration, AuthConfig
+from mcp_orchestrator.server import registry as registry_module
 from mcp_orchestrator.server.registry import ServerRegistry
 from mcp_orchestrator.storage.memory import InMemoryStorage
 
@@ -104,6 +107,22 @@ async def test_list_servers(registry):
     assert "server3" in names
 
 
+@pytest.mark.asyncio
+async def test_list_servers_reflects_writes(registry):
+    """Test that list_all sees registrations, status updates and removals."""
+    await registry.register(ServerRegistration(name="server1", url="https://1.example.com"))
+    assert [s.name for s in await registry.list_all()] == ["server1"]
+    
+    await registry.register(ServerRegistration(name="server2", url="https://2.example.com"))
+    await registry.update_status("server1", "active")
+    by_name = {s.name: s for s in await registry.list_all()}
+    assert set(by_name) == {"server1", "server2"}
+    assert by_name["server1"].status == "active"
+    
+    await registry.unregister("server2")
+    assert [s.name for s in await registry.list_all()] == ["server1"]
+
+
 @pytest.mark.asyncio
 async def test_update_status(registry):
     """Test updating server status."""
@@ -173,3 +192,153 @@ async def test_get_auth_config(registry):
     assert auth_config is not None
     assert auth_config.type == "static"
     assert auth_config.headers["Authorization"] == "Bearer token123"
+
+
+@pytest.mark.asyncio
+async def test_get_restores_stored_timestamps(registry):
+    """Test that timestamps stored as ISO strings come back as datetimes."""
+    registration = ServerRegistration(
+        name="test-server",
+        url="https://test.example.com",
+    )
+    
+    await registry.register(registration)
+    await registry.update_status("test-server", "active")
+    
+    server = await registry.get("test-server")
+    assert isinstance(server.registered_at, datetime)
+    assert isinstance(server.last_health_check, datetime)
+
+
+@pytest.mark.asyncio
+async def test_store_tools_writes_metadata(registry):
+    """Test that storing tools also stores per-tool metadata."""
+    registration = ServerRegistration(
+        name="test-server",
+        url="https://test.example.com",
+    )
+    
+    await registry.register(registration)
+    await registry.store_tools("test-server", [
+        {"name": "tool1", "description": "First tool", "input_schema": {"type": "object"}},
+        {"name": "tool2", "description": "Second tool"},
+    ])
+    
+    meta = await registry.get_tool_metadata("test-server__tool1")
+    assert meta["server_name"] == "test-server"
+    assert meta["tool_name"] == "tool1"
+    assert meta["input_schema"] == {"type": "object"}
+    assert len(await registry.get_all_tool_metadata()) == 2
+    
+    many = await registry.get_tool_metadata_many(["test-server__tool2", "test-server__missing"])
+    assert many[0]["tool_name"] == "tool2"
+    assert many[1] is None
+    
+    # Unregistering removes all metadata for the server
+    await registry.unregister("test-server")
+    assert await registry.get_tool_metadata("test-server__tool1") is None
+    assert await registry.get_all_tool_metadata() == []
+
+
+@pytest.mark.asyncio
+async def test_unregister_keeps_metadata_of_prefixed_server(registry):
+    """Test that unregistering a server spares servers sharing its name prefix."""
+    await registry.register(ServerRegistration(name="api", url="https://1.example.com"))
+    await registry.register(ServerRegistration(name="api__v2", url="https://2.example.com"))
+    await registry.store_tools("api", [{"name": "t1"}])
+    await registry.store_tools("api__v2", [{"name": "t2"}])
+    
+    await registry.unregister("api")
+    
+    assert await registry.get_tool_metadata("api__t1") is None
+    meta = await registry.get_tool_metadata("api__v2__t2")
+    assert meta["server_name"] == "api__v2"
+    assert [m["namespaced_name"] for m in await registry.get_all_tool_metadata()] == ["api__v2__t2"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_discovered_runs_once_for_deferred_server(registry):
+    """Test that deferred servers are discovered lazily and only once."""
+    calls = []
+    
+    async def discover(server):
+        calls.append(server.name)
+        return [{"name": "tool1", "description": "First tool"}]
+    
+    await registry.register(ServerRegistration(
+        name="lazy-server",
+        url="https://lazy.example.com",
+        loading_mode="deferred",
+    ))
+    await registry.register(ServerRegistration(
+        name="eager-server",
+        url="https://eager.example.com",
+    ))
+    
+    assert registry.pending_discovery() == ["lazy-server"]
+    assert await registry.ensure_discovered("eager-server", discover) is None
+    
+    tools = await registry.ensure_discovered("lazy-server", discover)
+    assert tools == [{"name": "tool1", "description": "First tool"}]
+    assert await registry.ensure_discovered("lazy-server", discover) is None
+    
+    assert calls == ["lazy-server"]
+    assert registry.pending_discovery() == []
+    assert (await registry.get("lazy-server")).tool_count == 1
+    assert await registry.get_tool_metadata("lazy-server__tool1") is not None
+
+
+@pytest.mark.asyncio
+async def test_ensure_discovered_backs_off_after_failure(registry, monkeypatch):
+    """Test that a failed deferred discovery is not retried until backoff ends."""
+    calls = []
+    
+    async def discover(server):
+        calls.append(server.name)
+        raise ConnectionError("unreachable")
+    
+    await registry.register(ServerRegistration(
+        name="dead-server",
+        url="https://dead.example.com",
+        loading_mode="deferred",
+    ))
+    
+    with pytest.raises(ConnectionError):
+        await registry.ensure_discovered("dead-server", discover)
+    assert (await registry.get("dead-server")).status == "error"
+    
+    # Still pending, but skipped while backing off
+    assert registry.pending_discovery() == []
+    assert await registry.ensure_discovered("dead-server", discover) is None
+    assert calls == ["dead-server"]
+    
+    # Once the backoff elapses the server is dialed again
+    now = time.monotonic()
+    monkeypatch.setattr(registry_module, "time", SimpleNamespace(monotonic=lambda: now + 3600))
+    assert registry.pending_discovery() == ["dead-server"]
+    with pytest.raises(ConnectionError):
+        await registry.ensure_discovered("dead-server", discover)
+    assert calls == ["dead-server", "dead-server"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enable_cache", [True, False])
+async def test_reads_reflect_writes(storage, enable_cache):
+    """Test that cached and uncached reads both see registry writes."""
+    registry = ServerRegistry(storage, enable_cache=enable_cache)
+    registration = ServerRegistration(
+        name="test-server",
+        url="https://test.example.com",
+        auth=AuthConfig(type="static", headers={"Authorization": "Bearer t"}),
+    )
+    
+    await registry.register(registration)
+    await registry.update_tool_count("test-server", 7)
+    
+    server = await registry.get("test-server")
+    assert server.tool_count == 7
+    assert (await registry.get_auth_config("test-server")).headers == {"Authorization": "Bearer t"}
+    
+    await registry.unregister("test-server")
+    assert await registry.get("test-server") is None
+    assert await registry.get_auth_config("test-server") is None
@@ -0,0 +1,160 @@
+"""Tests for tool router."""
+
+import asyncio
+import sys
+from pathlib import Path
+import httpx
+import pytest
+import respx
+from mcp.client.stdio import StdioServerParameters
+from mcp_orchestrator.tools import router as router_module
+from mcp_orchestrator.tools.router import ToolRouter, request_headers
+
+SAMPLE_STDIO_PARAMS = StdioServerParameters(
+    command=sys.executable,
+    args=[str(Path(__file__).resolve().parent.parent / "stdio_server" / "server.py")],
+)
+
+
+@pytest.fixture
+async def router():
+    """Create tool router for testing."""
+    router = ToolRouter()
+    yield router
+    await router.close()
+
+
+def _pool_http2(client) -> bool:
+    """Whether the client's connection pool offers HTTP/2 via ALPN."""
+    return client._transport._pool._http2
+
+
+def test_http_client_advertises_h2(router):
+    """Test that pooled clients enable HTTP/2 when h2 is installed."""
+    pytest.importorskip("h2")
+    client = router.http_client("https://example.com/mcp")
+    assert _pool_http2(client) is True
+
+
+def test_http_client_without_h2(router, monkeypatch):
+    """Test that pooled clients fall back to HTTP/1.1 without h2."""
+    monkeypatch.setattr(router_module, "_H2_AVAILABLE", False)
+    client = router.http_client("https://example.com/mcp")
+    assert _pool_http2(client) is False
+
+
+def test_http_client_pooled_per_origin(router):
+    """Test that requests to one origin share a client."""
+    client = router.http_client("https://example.com/a")
+    assert router.http_client("https://example.com/b") is client
+    assert router.http_client("https://other.example.com/a") is not client
+
+
+@pytest.mark.asyncio
+async def test_http_client_sends_headers_per_request(router):
+    """Test that callers with different auth tokens share one client."""
+    url = "https://example.com/mcp"
+    
+    async def send(token):
+        with request_headers({"Authorization": f"Bearer {token}"}):
+            await router.http_client(url).get(url)
+    
+    with respx.mock:
+        route = respx.get(url).respond(200)
+        await asyncio.gather(send("a"), send("b"))
+        await router.http_client(url).get(url)
+        seen = [call.request.headers.get("authorization") for call in route.calls]
+    
+    assert sorted(seen[:2]) == ["Bearer a", "Bearer b"]
+    assert seen[2] is None
+    assert len(router._http_clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_http_client_timeout_override(slow_http_url):
+    """Test that a longer per-caller timeout outlives the router default."""
+    router = ToolRouter(timeout=0.1)
+    try:
+        with pytest.raises(httpx.ReadTimeout):
+            await router.http_client(slow_http_url).get(slow_http_url)
+        
+        patient = router.http_client(slow_http_url, timeout=5.0)
+        assert patient is not router.http_client(slow_http_url)
+        response = await patient.get(slow_http_url)
+        assert response.status_code == 200
+    finally:
+        await router.close()
+
+
+async def _list_tool_names(router: ToolRouter):
+    result = await router.stdio_request(
+        "sample", SAMPLE_STDIO_PARAMS, lambda session: session.list_tools()
+    )
+    return [tool.name for tool in result.tools]
+
+
+@pytest.mark.asyncio
+async def test_stdio_session_survives_request_errors(router):
+    """Test that a failing call or a caller's timeout keeps the shared session."""
+    assert "echo" in await _list_tool_names(router)
+    entry = router._stdio_sessions["sample"]
+    
+    async def hang(session):
+        await asyncio.sleep(10)
+    
+    # The server answers with a JSON-RPC error (McpError)
+    with pytest.raises(Exception):
+        await router.stdio_request(
+            "sample", SAMPLE_STDIO_PARAMS, lambda session: session.call_tool("missing", {})
+        )
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.1):
+            await router.stdio_request("sample", SAMPLE_STDIO_PARAMS, hang)
+    
+    assert router._stdio_sessions["sample"] is entry
+    assert entry.alive
+    assert "echo" in await _list_tool_names(router)
+
+
+@pytest.mark.asyncio
+async def test_stdio_session_respawned_after_transport_error(router):
+    """Test that a broken pipe discards the session so the next call respawns it."""
+    await _list_tool_names(router)
+    entry = router._stdio_sessions["sample"]
+    
+    async def broken(session):
+        raise BrokenPipeError()
+    
+    with pytest.raises(BrokenPipeError):
+        await router.stdio_request("sample", SAMPLE_STDIO_PARAMS, broken)
+    
+    assert "sample" not in router._stdio_sessions
+    assert "echo" in await _list_tool_names(router)
+    assert router._stdio_sessions["sample"] is not entry
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("auth_mode, transport, expected", [
+    ("auto", "http", {"Authorization": "Bearer client"}),
+    ("auto", "stdio", {"X-Api-Key": "static"}),
+    ("forward", "stdio", {"Authorization": "Bearer client"}),
+    ("static", "http", {"X-Api-Key": "static"}),
+])
+async def test_call_tool_client_auth_forwarding(monkeypatch, auth_mode, transport, expected):
+    """Test that the client's auth header is forwarded only when the auth mode allows."""
+    router = ToolRouter(auth_mode=auth_mode, transport=transport)
+    sent = []
+    
+    async def call_tool_http(**kwargs):
+        sent.append(kwargs["auth_headers"])
+    
+    monkeypatch.setattr(router, "_call_tool_http", call_tool_http)
+    await router.call_tool(
+        server_name="remote",
+        server_url="https://remote.example.com/mcp",
+        tool_name="echo",
+        arguments={},
+        auth_headers={"X-Api-Key": "static"},
+        client_auth_header="Bearer client",
+    )
+    assert sent == [expected]
@@ -1,7 +1,7 @@
 """Tests for tool search service."""
 
 import pytest
-from mcp_orchestrator.tools.search import ToolSearchService
+from mcp_orchestrator.tools.search import SEMANTIC_BOOSTS, ToolSearchService, _tokenize
 
 
 @pytest.fixture
@@ -162,6 +162,18 @@ def test_get_tool(search_service):
     assert tool.server_name == "my-server"
 
 
+def test_get_tool_with_missing_fields(search_service):
+    """Test that null description and schema are indexed as empty values."""
+    search_service.index_tools(
+        "my-server", [{"name": "bare_tool", "description": None, "input_schema": None}]
+    )
+    
+    tool = search_service.get_tool("my-server__bare_tool")
+    assert tool is not None
+    assert tool.description == ""
+    assert tool.input_schema == {}
+
+
 def test_get_nonexistent_tool(search_service):
     """Test getting a tool that doesn't exist."""
     tool = search_service.get_tool("server__nonexistent")
@@ -189,6 +201,59 @@ def test_remove_server_tools(search_service):
     assert all_tools[0].server_name == "server2"
 
 
+def test_remove_server_tools_ignores_prefixed_server_names(search_service):
+    """Test removing a server leaves servers sharing its name prefix alone."""
+    search_service.index_tools("api", [{"name": "tool1", "description": "", "input_schema": {}}])
+    search_service.index_tools("api__v2", [{"name": "tool2", "description": "", "input_schema": {}}])
+    
+    search_service.remove_server_tools("api")
+    
+    assert [t.server_name for t in search_service.get_all_tools()] == ["api__v2"]
+
+
+def test_search_bm25_after_remove_and_reindex(search_service):
+    """Test BM25 search only returns currently indexed tools."""
+    search_service.index_tools("server1", [
+        {"name": "get_weather", "description": "Get current weather", "input_schema": {}},
+    ])
+    search_service.index_tools("server2", [
+        {"name": "weather_alerts", "description": "List weather alerts", "input_schema": {}},
+    ])
+    
+    search_service.remove_server_tools("server1")
+    results = search_service.search_bm25("weather", limit=5)
+    assert [r.namespaced_name for r in results] == ["server2__weather_alerts"]
+    
+    # Re-indexing replaces the old text rather than adding to it
+    search_service.index_tools("server2", [
+        {"name": "weather_alerts", "description": "List storm alerts", "input_schema": {}},
+    ])
+    assert search_service.search_bm25("storm", limit=5)[0].tool_name == "weather_alerts"
+    assert search_service.search_bm25("unrelated", limit=5) == []
+
+
+def test_search_bm25_matches_name_words_and_equivalents(search_service):
+    """Test BM25 splits snake_case names and counts semantic equivalents."""
+    search_service.index_tools("my-server", [
+        {"name": "get_library_docs", "description": "Fetch reference material", "input_schema": {}},
+        {"name": "send_email", "description": "Send an email", "input_schema": {}},
+    ])
+    
+    results = search_service.search_bm25("library", limit=5)
+    assert [r.tool_name for r in results] == ["get_library_docs"]
+    
+    # "documentation" only matches through its equivalent "docs"
+    results = search_service.search_bm25("documentation", limit=5)
+    assert [r.tool_name for r in results] == ["get_library_docs"]
+
+
+def test_semantic_boosts_survive_tokenization():
+    """Test that every boost keyword and equivalent is a term BM25 can index."""
+    for term, equivalents in SEMANTIC_BOOSTS.items():
+        for word in (term, *equivalents):
+            assert _tokenize(word) == [word]
+
+
 def test_invalid_regex_pattern(search_service):
     """Test that invalid regex raises ValueError."""
     with pytest.raises(ValueError, match="Invalid regex"):
@@ -107,6 +107,24 @@ async def test_memory_storage_hash_operations(memory_storage):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_memory_storage_hgetall_view_and_copy(memory_storage):
+    """Test that hgetall is a live read-only view and hgetall_copy a snapshot."""
+    await memory_storage.hset("hash1", "field1", "value1")
+    view = await memory_storage.hgetall("hash1")
+    snapshot = await memory_storage.hgetall_copy("hash1")
+    
+    await memory_storage.hset("hash1", "field2", "value2")
+    
+    assert dict(view) == {"field1": "value1", "field2": "value2"}
+    assert snapshot == {"field1": "value1"}
+    with pytest.raises(TypeError):
+        view["field3"] = "value3"
+    snapshot["field3"] = "value3"
+    assert await memory_storage.hget("hash1", "field3") is None
+    assert await memory_storage.hgetall_copy("missing") == {}
+
+
 @pytest.mark.asyncio
 async def test_memory_storage_ttl():
     """Test TTL functionality."""
@@ -126,6 +144,22 @@ async def test_memory_storage_ttl():
     assert await storage.get("key1") is None
 
 
+@pytest.mark.asyncio
+async def test_memory_storage_ttl_overwrite():
+    """Test overwriting a key drops its earlier expiry."""
+    storage = InMemoryStorage()
+    
+    await storage.set("key1", "old", ttl=1)
+    await storage.set("key1", "new")
+    await storage.set("key2", "value2", ttl=1)
+    
+    await asyncio.sleep(1.5)
+    
+    # Only key2 should have been purged
+    assert await storage.keys() == ["key1"]
+    assert await storage.get("key1") == "new"
+
+
 @pytest.mark.asyncio
 async def test_memory_storage_close(memory_storage):
     """Test close operation clears all data."""
@@ -153,3 +187,74 @@ async def test_storage_with_complex_values(memory_storage):
     result = await memory_storage.get("complex")
     
     assert result == complex_value
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_mset(memory_storage):
+    """Test setting multiple values at once."""
+    await memory_storage.set("key1", "old", ttl=60)
+    await memory_storage.mset({"key1": "value1", "key2": {"nested": True}})
+    
+    assert await memory_storage.get("key1") == "value1"
+    assert await memory_storage.get("key2") == {"nested": True}
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_mset_reclaims_expired():
+    """Test that TTL writes through mset purge keys that expired unread."""
+    storage = InMemoryStorage()
+    
+    await storage.mset({"old1": "value1", "old2": "value2"}, ttl=1)
+    await asyncio.sleep(1.5)
+    await storage.mset({"new": "value"}, ttl=60)
+    
+    # Expired keys are gone from the backing dict without being read
+    assert set(storage._data) == {"new"}
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_exists_many(memory_storage):
+    """Test counting existing keys at once."""
+    await memory_storage.set("key1", "value1")
+    await memory_storage.set("key2", "value2")
+    
+    assert await memory_storage.exists_many(["key1", "key2", "missing"]) == 2
+    assert await memory_storage.exists_many([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_delete_many(memory_storage):
+    """Test deleting multiple keys at once."""
+    await memory_storage.set("key1", "value1")
+    await memory_storage.set("key2", "value2")
+    await memory_storage.set("other", "value3")
+    
+    deleted = await memory_storage.delete_many(["key1", "key2", "missing"])
+    assert deleted == 2
+    assert await memory_storage.keys("*") == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_set_operations(memory_storage):
+    """Test set and multi-get operations."""
+    assert await memory_storage.sadd("set1", "a", "b") == 2
+    assert await memory_storage.sadd("set1", "b", "c") == 1
+    assert await memory_storage.smembers("set1") == {"a", "b", "c"}
+    
+    assert await memory_storage.srem("set1", "a", "missing") == 1
+    assert await memory_storage.smembers("set1") == {"b", "c"}
+    assert await memory_storage.smembers("nonexistent") == set()
+    
+    await memory_storage.set("key1", "value1")
+    assert await memory_storage.mget(["key1", "missing"]) == ["value1", None]
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_iter_keys(memory_storage):
+    """Test iterating over keys matching a pattern."""
+    await memory_storage.set("key1", "value1")
+    await memory_storage.set("key2", "value2")
+    await memory_storage.set("other", "value3")
+    
+    keys = [key async for key in memory_storage.iter_keys("key*")]
+    assert sorted(keys) == ["key1", "key2"]